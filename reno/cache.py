@@ -37,16 +37,23 @@ def build_cache_db(conf, versions_to_include):
         # Build a cache data structure including the file contents as well
         # as the basic data returned by the scanner.
         file_contents = {}
+        # Notes backported to other branches show up under several
+        # versions with the same SHA, so only read and parse each one
+        # once.
+        parsed = {}
         for version in versions_to_include:
             for filename, sha in notes[version]:
-                body = s.get_file_at_commit(filename, sha)
-                # We want to save the contents of the file, which is YAML,
-                # inside another YAML file. That looks terribly ugly with
-                # all of the escapes needed to format it properly as
-                # embedded YAML, so parse the input and convert it to a
-                # data structure that can be serialized cleanly.
-                y = yaml.safe_load(body)
-                file_contents[filename] = y
+                key = (filename, sha)
+                if key not in parsed:
+                    body = s.get_file_at_commit(filename, sha)
+                    # We want to save the contents of the file, which is
+                    # YAML, inside another YAML file. That looks terribly
+                    # ugly with all of the escapes needed to format it
+                    # properly as embedded YAML, so parse the input and
+                    # convert it to a data structure that can be
+                    # serialized cleanly.
+                    parsed[key] = yaml.safe_load(body)
+                file_contents[filename] = parsed[key]
 
         cache = {
             'notes': [
@@ -58,6 +65,9 @@ def build_cache_db(conf, versions_to_include):
                 for k, v in s.get_version_dates().items()
             ],
             'file-contents': file_contents,
+            # Record where the branch was, so readers can tell when
+            # the cache falls behind the repository.
+            'head': s.get_branch_head(conf.branch),
         }
         return cache
 
@@ -15,6 +15,7 @@ from datetime import datetime
 import logging
 import os.path
 
+from dulwich import errors
 import yaml
 
 from reno import scanner
@@ -73,6 +74,11 @@ class Loader(object):
             with open(self._cache_filename, 'r', encoding=self._encoding) as f:
                 self._cache = yaml.safe_load(f.read())
 
+            if self._cache and self._cache_is_stale():
+                LOG.debug('ignoring stale cache file %s',
+                          self._cache_filename)
+                self._cache = None
+
         if self._cache:
             # Save the cached scanner output to the same attribute
             # it would be in if we had loaded it "live". This
@@ -90,6 +96,29 @@ class Loader(object):
             self._scanner_output = self._scanner.get_notes_by_version()
             self._tags_to_dates = self._scanner.get_version_dates()
 
+    def _cache_is_stale(self):
+        """Return True if the branch has moved since the cache was written.
+
+        Caches that do not record the commit they were built from, and
+        caches read without a git repository, as when building from an
+        sdist, are always used.
+
+        """
+        cached_head = self._cache.get('head')
+        if not cached_head:
+            return False
+        try:
+            with scanner.Scanner(self._config) as s:
+                head = s.get_branch_head(self._branch)
+        except (errors.NotGitRepository, KeyError, ValueError) as err:
+            LOG.debug('could not find the current commit: %s', err)
+            return False
+        if head != cached_head:
+            LOG.debug('cache was built at %s, branch is now at %s',
+                      cached_head, head)
+            return True
+        return False
+
     def close(self):
         """Close any files opened by this loader."""
         if self._scanner is not None:
@@ -12,6 +12,7 @@
 
 import collections
 import fnmatch
+import functools
 import logging
 import os.path
 import re
@@ -36,7 +37,16 @@ def _parse_version(v):
     return result
 
 
+# Matches the unique id at the end of the name of a note file, like
+# releasenotes/notes/slug-0123456789abcdef.yaml
+_UNIQUE_ID_RE = re.compile(r'([0-9a-f]{16})\.[^./\\]*$')
+
+
+@functools.lru_cache(maxsize=8192)
 def _get_unique_id(filename):
+    match = _UNIQUE_ID_RE.search(filename)
+    if match:
+        return match.group(1)
     base = os.path.basename(filename)
     root, ext = os.path.splitext(base)
     uniqueid = root[-16:]
@@ -99,7 +109,7 @@ def _changes_in_subdir(repo, walk_entry, subdir):
         parent_tree = repo[repo[parents[0]].tree]
         parent_subtree = repo._get_subtree(parent_tree, subdir)
         if parent_subtree:
-            parent_subtree = parent_subtree.sha().hexdigest().encode('ascii')
+            parent_subtree = parent_subtree.id
     else:
         changes_func = diff_tree.tree_changes_for_merge
         parent_subtree = [
@@ -107,13 +117,13 @@ def _changes_in_subdir(repo, walk_entry, subdir):
             for p in parents
         ]
         parent_subtree = [
-            p.sha().hexdigest().encode('ascii')
+            p.id
             for p in parent_subtree
             if p
         ]
     subdir_tree = repo._get_subtree(repo[commit.tree], subdir)
     if subdir_tree:
-        commit_subtree = subdir_tree.sha().hexdigest().encode('ascii')
+        commit_subtree = subdir_tree.id
     else:
         commit_subtree = None
     if parent_subtree == commit_subtree:
@@ -149,6 +159,7 @@ class _ChangeAggregator(object):
     _modify_op = set([diff_tree.CHANGE_MODIFY])
     _delete_op = set([diff_tree.CHANGE_DELETE])
     _add_op = set([diff_tree.CHANGE_ADD])
+    _new_path_op = frozenset([diff_tree.CHANGE_ADD, diff_tree.CHANGE_MODIFY])
 
     def __init__(self):
         # Track UIDs that had a duplication issue but have been
@@ -158,36 +169,27 @@ class _ChangeAggregator(object):
     def aggregate_changes(self, walk_entry, changes):
         sha = walk_entry.commit.id
         by_uid = collections.defaultdict(list)
+        change_delete = diff_tree.CHANGE_DELETE
+        new_path_ops = self._new_path_op
         for ec in changes:
             if not isinstance(ec, list):
                 ec = [ec]
-            else:
-                ec = ec
             for c in ec:
                 LOG.debug('change %r', c)
-                if c.type == diff_tree.CHANGE_ADD:
-                    path = c.new.path.decode('utf-8') if c.new.path else None
-                    if _note_file(path):
-                        uid = _get_unique_id(path)
-                        by_uid[uid].append((c.type, path, sha))
-                    else:
-                        LOG.debug('ignoring')
-                elif c.type == diff_tree.CHANGE_DELETE:
-                    path = c.old.path.decode('utf-8') if c.old.path else None
-                    if _note_file(path):
-                        uid = _get_unique_id(path)
-                        by_uid[uid].append((c.type, path, sha))
-                    else:
-                        LOG.debug('ignoring')
-                elif c.type == diff_tree.CHANGE_MODIFY:
-                    path = c.new.path.decode('utf-8') if c.new.path else None
-                    if _note_file(path):
-                        uid = _get_unique_id(path)
-                        by_uid[uid].append((c.type, path, sha))
-                    else:
-                        LOG.debug('ignoring')
+                # Deletes only have an old path; adds and modifies are
+                # reported under their new path.
+                if c.type == change_delete:
+                    path = c.old.path
+                elif c.type in new_path_ops:
+                    path = c.new.path
                 else:
                     raise ValueError('unhandled change type: {!r}'.format(c))
+                path = path.decode('utf-8') if path else None
+                if _note_file(path):
+                    uid = _get_unique_id(path)
+                    by_uid[uid].append((c.type, path, sha))
+                else:
+                    LOG.debug('ignoring')
 
         results = []
         for uid, changes in sorted(by_uid.items()):
@@ -246,7 +248,7 @@ class _ChangeTracker(object):
         # Track the versions we have seen and the earliest version for
         # which we have seen a given note's unique id.
         self.versions = []
-        self.earliest_seen = collections.OrderedDict()
+        self.earliest_seen = {}
         # Remember the most current filename for each id, to allow for
         # renames.
         self.last_name_by_id = {}
@@ -442,7 +444,10 @@ class RenoRepo(repo.Repo):
         "Return the tag(s) on a commit, in application order."
         if self._all_tags is None:
             self._load_tags()
-        tags_and_dates = self._shas_to_tags.get(sha, [])
+        tags_and_dates = self._shas_to_tags.get(sha)
+        if not tags_and_dates:
+            # Most commits are not tagged, so skip the sort.
+            return []
         tags_and_dates.sort(key=lambda x: x[1])
         return [t[0] for t in tags_and_dates]
 
@@ -599,8 +604,11 @@ class Scanner(object):
 
         If multiple tags are available, the first tags are pre-release tags.
         """
-        tags = (tag for tag in self._repo.get_tags_on_commit(sha)
-                if self.release_tag_re.match(tag))
+        all_tags = self._repo.get_tags_on_commit(sha)
+        if not all_tags:
+            # Avoid the regex matching and sorting for untagged commits.
+            return []
+        tags = (tag for tag in all_tags if self.release_tag_re.match(tag))
         # This makes sure that we order the list with pre_release_tag tags
         # first: in case where multiple tags match a commit, the non-pre
         # release tag will be last.
@@ -610,13 +618,22 @@ class Scanner(object):
 
     def _get_tags_on_branch(self, branch):
         "Return a list of tag names on the given branch."
+        if self._repo._all_tags is None:
+            self._repo._load_tags()
+        # Stop walking once every tagged commit in the repository has
+        # been seen, since nothing older can add to the results.
+        pending = set(self._repo._shas_to_tags)
         results = []
+        if not pending:
+            return results
         for c in self._get_walker_for_branch(branch):
-            # shas_to_tags has encoded versions of the shas
-            # but the commit object gives us a decoded version
-            sha = c.commit.sha().hexdigest().encode('ascii')
-            tags = self._get_valid_tags_on_commit(sha)
+            # The commit id is the encoded hex sha used as the key in
+            # shas_to_tags.
+            tags = self._get_valid_tags_on_commit(c.commit.id)
             results.extend(tags)
+            pending.discard(c.commit.id)
+            if not pending:
+                break
         return results
 
     def _get_current_version(self, branch=None):
@@ -625,13 +642,21 @@ class Scanner(object):
         # counts up to where the tag appears and it returns when it
         # finds the first tagged commit (there is no need to scan the
         # rest of the branch).
-        commit = self._repo[self._get_ref(branch)]
+        # Resolve the branch first so a bad name is always reported.
+        head = self._get_ref(branch)
+        if self._repo._all_tags is None:
+            self._repo._load_tags()
+        if not self._repo._shas_to_tags:
+            # Without any tags there is nothing to find, so skip
+            # walking the whole history.
+            return '0.0.0'
+        commit = self._repo[head]
         count = 0
         while commit:
-            # shas_to_tags has encoded versions of the shas
-            # but the commit object gives us a decoded version
-            sha = commit.sha().hexdigest().encode('ascii')
-            tags = self._get_valid_tags_on_commit(sha)
+            # The commit id is already the encoded hex sha used as the
+            # key in shas_to_tags, so there is no need to hash the
+            # commit again to look up its tags.
+            tags = self._get_valid_tags_on_commit(commit.id)
             if tags:
                 if count:
                     val = '{}-{}'.format(tags[-1], count)
@@ -667,6 +692,16 @@ class Scanner(object):
 
         return stripped_tag
 
+    def _is_first_parent(self, branch, sha):
+        "Return True if sha is on the first-parent history of the branch."
+        commit = self._repo[self._get_ref(branch)]
+        while True:
+            if commit.id == sha:
+                return True
+            if not commit.parents:
+                return False
+            commit = self._repo[commit.parents[0]]
+
     def _get_branch_base(self, branch):
         "Return the tag at base of the branch."
         # Based on
@@ -678,15 +713,14 @@ class Scanner(object):
         # branch, then scan the commits that appear on the specified
         # branch until we find something that is on both.
         master_commits = set(
-            c.commit.sha().hexdigest()
+            c.commit.id
             for c in self._get_walker_for_branch(self.conf.default_branch)
         )
         for c in self._get_walker_for_branch(branch):
-            if c.commit.sha().hexdigest() in master_commits:
+            if c.commit.id in master_commits:
                 # We got to this commit via the branch, but it is also
                 # on master, so this is the base.
-                tags = self._get_valid_tags_on_commit(
-                    c.commit.sha().hexdigest().encode('ascii'))
+                tags = self._get_valid_tags_on_commit(c.commit.id)
                 if tags:
                     return tags[-1]
 
@@ -694,11 +728,11 @@ class Scanner(object):
         LOG.info(
             'There is no tag on commit %s at the base of %s. '
             'Branch scan short-cutting is disabled.',
-            c.commit.sha().hexdigest(), branch,
+            c.commit.id.decode('ascii'), branch,
         )
         return None
 
-    def _topo_traversal(self, branch):
+    def _topo_traversal(self, branch, stop_at=None):
         """Generator that yields the branch entries in topological order.
 
         The topo ordering in dulwich does not match the git command line
@@ -715,9 +749,17 @@ class Scanner(object):
         # |/
         # *   a7f573d original commit on master
 
+        If stop_at is given, it must be the SHA of a commit the
+        traversal will emit. The ancestors of that commit are not
+        visited at all, since they would only be emitted after it.
+
         """
         head = self._get_ref(branch)
 
+        exclude = []
+        if stop_at is not None:
+            exclude = self._repo[stop_at].parents
+
         # Map SHA values to Entry objects, because we will be traversing
         # commits not entries.
         all = {}
@@ -728,7 +770,7 @@ class Scanner(object):
         # entire graph once. It doesn't matter what order we do this
         # the first time, since we're just recording the relationships
         # of the nodes.
-        for e in self._repo.get_walker(head):
+        for e in self._repo.get_walker(head, exclude=exclude):
             all[e.commit.id] = e
             for p in e.commit.parents:
                 children.setdefault(p, set()).add(e.commit.id)
@@ -789,7 +831,8 @@ class Scanner(object):
                     # later, as long as we haven't already processed
                     # it.
                     first_parent = entry.commit.parents[0]
-                    if (first_parent not in todo
+                    if (first_parent in all
+                            and first_parent not in todo
                             and first_parent not in emitted):
                         todo.appendleft(first_parent)
                     continue
@@ -830,6 +873,9 @@ class Scanner(object):
                 # to grow very large, but it's not clear the output
                 # will be produced in the right order.
                 for p in entry.commit.parents:
+                    if p not in all:
+                        # Excluded by stop_at.
+                        continue
                     if p not in todo and p not in emitted:
                         todo.appendleft(p)
 
@@ -961,8 +1007,12 @@ class Scanner(object):
             return self._repo._tags_to_dates.copy()
         return {}
 
+    def get_branch_head(self, branch=None):
+        "Return the SHA of the commit at the tip of the branch."
+        return self._get_ref(branch).decode('ascii')
+
     def get_notes_by_version(self, branch=None):
-        """Return an OrderedDict mapping versions to lists of notes files.
+        """Return a dict mapping versions to lists of notes files.
 
         The versions are presented in reverse chronological order.
 
@@ -1141,10 +1191,24 @@ class Scanner(object):
                 if fname.startswith(prefix) and _note_file(fname):
                     tracker.delete(fname, None, '*working-copy*')
 
+        # If the scan is certain to reach the commit where it will
+        # stop, tell the traversal about it so it does not load the
+        # older history. When null-merges are ignored, a stop commit
+        # that was merged in from another branch may be skipped, and
+        # then the scan has to continue past it.
+        stop_at = None
+        if scan_stop_tag and scan_stop_tag in versions_by_date:
+            stop_sha, _ = self._repo._get_commit_from_tag(
+                scan_stop_tag, self._repo._all_tags[scan_stop_tag])
+            if (not self.conf.ignore_null_merges
+                    or self._is_first_parent(branch, stop_sha)):
+                stop_at = stop_sha
+
         aggregator = _ChangeAggregator()
 
         # Process the git commit history.
-        for counter, entry in enumerate(self._topo_traversal(branch), 1):
+        traversal = self._topo_traversal(branch, stop_at=stop_at)
+        for counter, entry in enumerate(traversal, 1):
 
             sha = entry.commit.id
             tags_on_commit = self._get_valid_tags_on_commit(sha)
@@ -1210,7 +1274,7 @@ class Scanner(object):
 
         # Invert earliest_seen to make a list of notes files for each
         # version.
-        files_and_tags = collections.OrderedDict()
+        files_and_tags = {}
         for v in tracker.versions:
             files_and_tags[v] = []
         # Produce a list of the actual files present in the repository. If
@@ -1233,7 +1297,7 @@ class Scanner(object):
         if collapse_pre_releases:
             LOG.debug('collapsing pre-release versions into final releases')
             collapsing = files_and_tags
-            files_and_tags = collections.OrderedDict()
+            files_and_tags = {}
             for ov in versions_by_date:
                 if ov not in collapsing:
                     # We don't need to collapse this one because there are
@@ -1263,7 +1327,7 @@ class Scanner(object):
         # Only return the parts of files_and_tags that actually have
         # filenames associated with the versions.
         LOG.debug('trimming')
-        trimmed = collections.OrderedDict()
+        trimmed = {}
         for ov in versions_by_date:
             if not files_and_tags.get(ov):
                 continue
@@ -1277,7 +1341,11 @@ class Scanner(object):
             # necessarily true. We want the notes to always show up in the
             # same order, but it doesn't really matter what order that is,
             # so just sort based on the unique id.
-            trimmed[ov] = sorted(files_and_tags[ov])
+            # The lists were built above for this purpose, so sort them
+            # in place instead of copying them.
+            notes = files_and_tags[ov]
+            notes.sort()
+            trimmed[ov] = notes
             # If we have been told to stop at a version, we can do that
             # now.
             if earliest_version and ov == earliest_version:
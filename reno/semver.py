@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import functools
 import logging
 
 from packaging import version
@@ -19,6 +20,12 @@ from reno import loader
 LOG = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_version(v):
+    "Return the parsed version, reusing earlier results."
+    return version.Version(v)
+
+
 def compute_next_version(conf):
     "Compute the next semantic version based on the available release notes."
     LOG.debug('starting semver-next')
@@ -35,7 +42,7 @@ def compute_next_version(conf):
                 continue
 
             # This check relies on PEP 440 versioning
-            parsed = version.Version(to_consider)
+            parsed = _parse_version(to_consider)
             if parsed.post:
                 to_include.append(to_consider)
                 continue
@@ -57,9 +64,9 @@ def compute_next_version(conf):
         if not candidate_bases:
             # We have a real tag and some locally modified files. Use the
             # real tag as the basis of the next version.
-            base_version = version.Version(ldr.versions[1])
+            base_version = _parse_version(ldr.versions[1])
         else:
-            base_version = version.Version(candidate_bases[0])
+            base_version = _parse_version(candidate_bases[0])
 
         LOG.debug('base version %s', base_version)
 
@@ -68,6 +75,13 @@ def compute_next_version(conf):
 
         for ver in to_include:
             for filename, sha in ldr[ver]:
+                # Once a minor bump is known, only a major bump can
+                # change the answer. If nothing would trigger one,
+                # there is no need to parse the rest of the notes.
+                if inc_minor and not conf.semver_major:
+                    LOG.debug('skipping remaining notes after minor bump')
+                    break
+
                 notes = ldr.parse_note_file(filename, sha)
 
                 for section in conf.semver_major:
@@ -76,19 +90,23 @@ def compute_next_version(conf):
                                   section, filename)
                         return '{}.0.0'.format(base_version.major + 1)
 
-                for section in conf.semver_minor:
-                    if notes.get(section, []):
-                        LOG.debug('found feature in %r section of %s',
-                                  section, filename)
-                        inc_minor = True
-                        break
-
-                for section in conf.semver_patch:
-                    if notes.get(section, []):
-                        LOG.debug('found bugfix in %r section of %s',
-                                  section, filename)
-                        inc_patch = True
-                        break
+                if not inc_minor:
+                    for section in conf.semver_minor:
+                        if notes.get(section, []):
+                            LOG.debug('found feature in %r section of %s',
+                                      section, filename)
+                            inc_minor = True
+                            break
+
+                # A minor bump resets the patch level, so there is
+                # nothing more to learn from the patch sections.
+                if not (inc_minor or inc_patch):
+                    for section in conf.semver_patch:
+                        if notes.get(section, []):
+                            LOG.debug('found bugfix in %r section of %s',
+                                      section, filename)
+                            inc_patch = True
+                            break
 
     major = base_version.major
     minor = base_version.minor
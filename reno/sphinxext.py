@@ -9,6 +9,7 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+import functools
 import os.path
 
 from docutils import nodes
@@ -28,6 +29,34 @@ from reno import loader
 LOG = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _find_reporoot(cwd, reporoot, relnotessubdir):
+    """Find root directory of project.
+
+    The result is cached because every directive in a document set
+    needs the same answer and discovering the repository touches the
+    filesystem. The fallback candidates are relative to the current
+    directory, so it is part of the key and the result is absolute.
+
+    """
+    # When building on RTD.org the root directory may not be
+    # the current directory, so look for it.
+    try:
+        return repo.Repo.discover(reporoot).path
+    except Exception:
+        pass
+
+    for root in ('.', '..', '../..'):
+        if os.path.exists(os.path.join(root, relnotessubdir)):
+            return os.path.abspath(root)
+
+    raise Exception(
+        'Could not discover root directory; tried: %s' % ', '.join([
+            os.path.abspath(root) for root in ('.', '..', '../..')
+        ])
+    )
+
+
 class ReleaseNotesDirective(rst.Directive):
 
     has_content = True
@@ -50,23 +79,9 @@ class ReleaseNotesDirective(rst.Directive):
 
     def _find_reporoot(self, reporoot_opt, relnotessubdir_opt):
         """Find root directory of project."""
-        reporoot = os.path.abspath(reporoot_opt)
-        # When building on RTD.org the root directory may not be
-        # the current directory, so look for it.
-        try:
-            return repo.Repo.discover(reporoot).path
-        except Exception:
-            pass
-
-        for root in ('.', '..', '../..'):
-            if os.path.exists(os.path.join(root, relnotessubdir_opt)):
-                return root
-
-        raise Exception(
-            'Could not discover root directory; tried: %s' % ', '.join([
-                os.path.abspath(root) for root in ('.', '..', '../..')
-            ])
-        )
+        return _find_reporoot(os.getcwd(),
+                              os.path.abspath(reporoot_opt),
+                              relnotessubdir_opt)
 
     def run(self):
         title = ' '.join(self.content)
@@ -129,10 +144,14 @@ class ReleaseNotesDirective(rst.Directive):
             )
 
         source_name = '<%s %s>' % (__name__, branch or 'current branch')
-        result = statemachine.ViewList()
-        for line_num, line in enumerate(text.splitlines(), 1):
+        lines = text.splitlines()
+        for line_num, line in enumerate(lines, 1):
             LOG.debug('%4d: %s', line_num, line)
-            result.append(line, source_name, line_num)
+        result = statemachine.ViewList(
+            lines,
+            source_name,
+            items=[(source_name, i) for i in range(1, len(lines) + 1)],
+        )
 
         node = nodes.section()
         node.document = self.state.document
@@ -15,10 +15,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
+import shutil
+import tempfile
+
 import fixtures
 import testtools
 
 
+def scratch_root():
+    """Return a tmpfs directory for scratch files, if there is one."""
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
+
+
 class TestCase(testtools.TestCase):
 
     """Test case base class for all unit tests."""
@@ -32,3 +43,26 @@ class TestCase(testtools.TestCase):
         self.stderr = self.useFixture(self._stderr_fixture).stream
         self.useFixture(fixtures.MonkeyPatch('sys.stderr', self.stderr))
         self.useFixture(fixtures.FakeLogger())
+
+
+class SharedTempDirTestCase(TestCase):
+
+    """Test case that keeps per-test directories under one shared root.
+
+    The root is created once for each class, on tmpfs when possible,
+    and removed along with everything in it in tearDownClass().
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(SharedTempDirTestCase, cls).setUpClass()
+        cls._tmproot = tempfile.mkdtemp(dir=scratch_root())
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmproot, ignore_errors=True)
+        super(SharedTempDirTestCase, cls).tearDownClass()
+
+    def make_tmpdir(self):
+        """Return a new, empty directory for the current test."""
+        return tempfile.mkdtemp(dir=self._tmproot)
@@ -13,6 +13,7 @@
 # under the License.
 
 import collections
+import copy
 from unittest import mock
 
 import fixtures
@@ -62,6 +63,11 @@ class TestCache(base.TestCase):
     def _get_dates(self):
         return {'1.0.0': 1547874431}
 
+    @classmethod
+    def setUpClass(cls):
+        super(TestCache, cls).setUpClass()
+        cls._config_template = config.Config('.')
+
     def setUp(self):
         super(TestCache, self).setUp()
         self.useFixture(
@@ -72,7 +78,11 @@ class TestCache(base.TestCase):
             fixtures.MockPatch('reno.scanner.Scanner.get_version_dates',
                                new=self._get_dates)
         )
-        self.c = config.Config('.')
+        self.useFixture(
+            fixtures.MockPatch('reno.scanner.Scanner.get_branch_head',
+                               return_value='0' * 40)
+        )
+        self.c = copy.copy(self._config_template)
 
     @mock.patch('reno.scanner.Scanner.get_notes_by_version')
     @mock.patch('reno.scanner.Scanner.get_series_branches')
@@ -106,6 +116,7 @@ class TestCache(base.TestCase):
                     'fixes': ['We fixed all the bugs!'],
                 },
             },
+            'head': '0' * 40,
         }
 
         db = cache.build_cache_db(
@@ -117,3 +128,30 @@ class TestCache(base.TestCase):
         mock_get_notes.assert_has_calls([
             mock.call(None), mock.call('stable/1.0')])
         self.assertEqual(expected, db)
+
+    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
+    @mock.patch('reno.scanner.Scanner.get_series_branches')
+    def test_build_cache_db_reads_shared_note_once(self, mock_get_branches,
+                                                   mock_get_notes):
+        mock_get_notes.side_effect = [
+            collections.OrderedDict([  # master
+                ('1.0.0', [('note1', 'shaA')]),
+            ]),
+            collections.OrderedDict([  # stable/1.0
+                ('1.0.1', [('note1', 'shaA')]),
+            ]),
+        ]
+        mock_get_branches.return_value = ['stable/1.0']
+
+        with mock.patch('reno.scanner.Scanner.get_file_at_commit',
+                        side_effect=self._get_note_body) as get_file:
+            db = cache.build_cache_db(
+                self.c,
+                versions_to_include=[],
+            )
+
+        get_file.assert_called_once_with('note1', 'shaA')
+        self.assertEqual(
+            {'note1': {'prelude': 'This is the prelude.\n'}},
+            db['file-contents'],
+        )
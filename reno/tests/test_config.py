@@ -15,7 +15,6 @@ import argparse
 import os
 from unittest import mock
 
-import fixtures
 from testtools import ExpectedException
 
 from reno import config
@@ -39,23 +38,30 @@ def expected_options(**overrides):
     return result
 
 
-class TestConfig(base.TestCase):
+class TestConfig(base.SharedTempDirTestCase):
     EXAMPLE_CONFIG = """
 collapse_pre_releases: false
 """
 
+    @classmethod
+    def setUpClass(cls):
+        super(TestConfig, cls).setUpClass()
+        # The parser is not modified by parse_args(), so build it once.
+        cls.parser = argparse.ArgumentParser()
+        main._build_query_arg_group(cls.parser)
+
     def setUp(self):
         super(TestConfig, self).setUp()
         # Temporary directory to store our config
-        self.tempdir = self.useFixture(fixtures.TempDir())
+        self.tempdir = self.make_tmpdir()
 
     def test_defaults(self):
-        c = config.Config(self.tempdir.path)
+        c = config.Config(self.tempdir)
         actual = c.options
         self.assertEqual(expected_options(), actual)
 
     def test_override(self):
-        c = config.Config(self.tempdir.path)
+        c = config.Config(self.tempdir)
         c.override(
             collapse_pre_releases=False,
         )
@@ -64,7 +70,7 @@ collapse_pre_releases: false
         self.assertEqual(expected, actual)
 
     def test_override_multiple(self):
-        c = config.Config(self.tempdir.path)
+        c = config.Config(self.tempdir)
         c.override(
             notesdir='value1',
         )
@@ -76,7 +82,7 @@ collapse_pre_releases: false
         self.assertEqual(expected, actual)
 
     def test_override_sections_with_subsections(self):
-        c = config.Config(self.tempdir.path)
+        c = config.Config(self.tempdir)
         c.override(
             sections=[
                 ["features", "Features"],
@@ -111,32 +117,32 @@ collapse_pre_releases: false
     def test_load_file_not_present(self):
         missing = 'reno.config.Config._report_missing_config_files'
         with mock.patch(missing) as error_handler:
-            config.Config(self.tempdir.path)
+            config.Config(self.tempdir)
             self.assertEqual(1, error_handler.call_count)
 
     def _test_load_file(self, config_path):
+        # The file is removed along with the rest of the class's
+        # temporary directories in tearDownClass().
         with open(config_path, 'w') as fd:
             fd.write(self.EXAMPLE_CONFIG)
-        self.addCleanup(os.unlink, config_path)
-        c = config.Config(self.tempdir.path)
+        c = config.Config(self.tempdir)
         self.assertEqual(False, c.collapse_pre_releases)
 
     def test_load_file_in_releasenotesdir(self):
-        rn_path = self.tempdir.join('releasenotes')
+        rn_path = os.path.join(self.tempdir, 'releasenotes')
         os.mkdir(rn_path)
-        config_path = self.tempdir.join('releasenotes/config.yaml')
+        config_path = os.path.join(self.tempdir, 'releasenotes', 'config.yaml')
         self._test_load_file(config_path)
 
     def test_load_file_in_repodir(self):
-        config_path = self.tempdir.join('reno.yaml')
+        config_path = os.path.join(self.tempdir, 'reno.yaml')
         self._test_load_file(config_path)
 
     def test_load_file_empty(self):
-        config_path = self.tempdir.join('reno.yaml')
+        config_path = os.path.join(self.tempdir, 'reno.yaml')
         with open(config_path, 'w') as fd:
             fd.write('# Add reno config here')
-        self.addCleanup(os.unlink, config_path)
-        c = config.Config(self.tempdir.path)
+        c = config.Config(self.tempdir)
         self.assertEqual(True, c.collapse_pre_releases)
 
     def test_get_default(self):
@@ -151,10 +157,8 @@ collapse_pre_releases: false
         )
 
     def _run_override_from_parsed_args(self, argv):
-        parser = argparse.ArgumentParser()
-        main._build_query_arg_group(parser)
-        args = parser.parse_args(argv)
-        c = config.Config(self.tempdir.path)
+        args = self.parser.parse_args(argv)
+        c = config.Config(self.tempdir)
         c.override_from_parsed_args(args)
         return c
 
@@ -195,7 +199,7 @@ collapse_pre_releases: false
         main._build_query_arg_group(parser)
         parser.add_argument('not_a_config_option')
         args = parser.parse_args(['value'])
-        c = config.Config(self.tempdir.path)
+        c = config.Config(self.tempdir)
         c.override_from_parsed_args(args)
         self.assertFalse(hasattr(c, 'not_a_config_option'))
 
@@ -204,8 +208,6 @@ class TestConfigProperties(base.TestCase):
 
     def setUp(self):
         super(TestConfigProperties, self).setUp()
-        # Temporary directory to store our config
-        self.tempdir = self.useFixture(fixtures.TempDir())
         self.c = config.Config('releasenotes')
 
     def test_reporoot(self):
@@ -43,11 +43,11 @@ class TestPickFileName(base.TestCase):
         self.assertIn('someslug', result)
 
 
-class TestCreate(base.TestCase):
+class TestCreate(base.SharedTempDirTestCase):
 
     def setUp(self):
         super(TestCreate, self).setUp()
-        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        self.tmpdir = self.make_tmpdir()
 
     def _create_user_template(self, contents):
         filename = create._pick_note_file_name(self.tmpdir, 'usertemplate')
@@ -118,12 +118,14 @@ class TestCreate(base.TestCase):
 
     def test_edit(self):
         self.useFixture(fixtures.EnvironmentVariable('EDITOR', 'myeditor'))
-        with mock.patch('subprocess.call') as call_mock:
-            self.assertTrue(create._edit_file('somepath'))
-            call_mock.assert_called_once_with(['myeditor', 'somepath'])
+        call_mock = self.useFixture(
+            fixtures.MockPatch('subprocess.call')).mock
+        self.assertTrue(create._edit_file('somepath'))
+        call_mock.assert_called_once_with(['myeditor', 'somepath'])
 
     def test_edit_without_editor_env_var(self):
         self.useFixture(fixtures.EnvironmentVariable('EDITOR'))
-        with mock.patch('subprocess.call') as call_mock:
-            self.assertFalse(create._edit_file('somepath'))
-            call_mock.assert_not_called()
+        call_mock = self.useFixture(
+            fixtures.MockPatch('subprocess.call')).mock
+        self.assertFalse(create._edit_file('somepath'))
+        call_mock.assert_not_called()
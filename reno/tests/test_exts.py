@@ -19,37 +19,80 @@ from reno import config
 from reno.tests import base
 
 
+_NOTESDIR_HELP = textwrap.dedent("""\
+    The notes subdirectory within the relnotesdir where the
+    notes live.
+    """)
+
+_COLLAPSE_HELP = textwrap.dedent("""\
+    Should pre-release versions be merged into the final release
+    of the same number (1.0.0.0a1 notes appear under 1.0.0).
+    """)
+
+_RELEASE_TAG_RE_DEFAULT = textwrap.dedent('''\
+    ((?:[\\d.ab]|rc)+)  # digits, a, b, and rc cover regular and
+                       # pre-releases
+    ''')
+
+_RELEASE_TAG_RE_HELP = textwrap.dedent("""\
+    The regex pattern used to match the repo tags representing a
+    valid release version. The pattern is compiled with the
+    verbose and unicode flags enabled.
+    """)
+
+_SIMPLE_DEFAULT_EXPECTED = textwrap.dedent("""\
+    ``notesdir``
+      The notes subdirectory within the relnotesdir where the
+      notes live.
+
+      Defaults to ``'path/to/notes'``
+    """)
+
+_BOOL_DEFAULT_EXPECTED = textwrap.dedent("""\
+    ``collapse_pre_releases``
+      Should pre-release versions be merged into the final release
+      of the same number (1.0.0.0a1 notes appear under 1.0.0).
+
+      Defaults to ``True``
+    """)
+
+_MULTILINE_DEFAULT_EXPECTED = textwrap.dedent("""\
+    ``release_tag_re``
+      The regex pattern used to match the repo tags representing a
+      valid release version. The pattern is compiled with the
+      verbose and unicode flags enabled.
+
+      Defaults to
+
+      ::
+
+        ((?:[\\d.ab]|rc)+)  # digits, a, b, and rc cover regular and
+                           # pre-releases
+    """)
+
+
 class TestMultiLineString(base.TestCase):
 
     def test_no_indent(self):
-        input = textwrap.dedent("""\
-        The notes subdirectory within the relnotesdir where the
-        notes live.
-        """)
         expected = '\n'.join([
             'The notes subdirectory within the relnotesdir where the',
             'notes live.',
         ])
-        actual = '\n'.join(show_reno_config._multi_line_string(input))
+        actual = '\n'.join(
+            show_reno_config._multi_line_string(_NOTESDIR_HELP))
         self.assertEqual(expected, actual)
 
     def test_with_indent(self):
-        input = textwrap.dedent("""\
-        The notes subdirectory within the relnotesdir where the
-        notes live.
-        """)
         expected = '\n'.join([
             '  The notes subdirectory within the relnotesdir where the',
             '  notes live.',
         ])
-        actual = '\n'.join(show_reno_config._multi_line_string(input, '  '))
+        actual = '\n'.join(
+            show_reno_config._multi_line_string(_NOTESDIR_HELP, '  '))
         self.assertEqual(expected, actual)
 
     def test_first_line_blank(self):
-        input = textwrap.dedent("""
-        The notes subdirectory within the relnotesdir where the
-        notes live.
-        """)
+        input = '\n' + _NOTESDIR_HELP
         expected = '\n'.join([
             '  The notes subdirectory within the relnotesdir where the',
             '  notes live.',
@@ -61,66 +104,20 @@ class TestMultiLineString(base.TestCase):
 class TestFormatOptionHelp(base.TestCase):
 
     def test_simple_default(self):
-        opt = config.Opt(
-            'notesdir', 'path/to/notes',
-            textwrap.dedent("""\
-            The notes subdirectory within the relnotesdir where the
-            notes live.
-            """),
-        )
+        opt = config.Opt('notesdir', 'path/to/notes', _NOTESDIR_HELP)
         actual = '\n'.join(show_reno_config._format_option_help([opt]))
-        expected = textwrap.dedent("""\
-        ``notesdir``
-          The notes subdirectory within the relnotesdir where the
-          notes live.
-
-          Defaults to ``'path/to/notes'``
-        """)
-        self.assertEqual(expected, actual)
+        self.assertEqual(_SIMPLE_DEFAULT_EXPECTED, actual)
 
     def test_bool_default(self):
-        opt = config.Opt(
-            'collapse_pre_releases', True,
-            textwrap.dedent("""\
-            Should pre-release versions be merged into the final release
-            of the same number (1.0.0.0a1 notes appear under 1.0.0).
-            """),
-        )
+        opt = config.Opt('collapse_pre_releases', True, _COLLAPSE_HELP)
         actual = '\n'.join(show_reno_config._format_option_help([opt]))
-        expected = textwrap.dedent("""\
-        ``collapse_pre_releases``
-          Should pre-release versions be merged into the final release
-          of the same number (1.0.0.0a1 notes appear under 1.0.0).
-
-          Defaults to ``True``
-        """)
-        self.assertEqual(expected, actual)
+        self.assertEqual(_BOOL_DEFAULT_EXPECTED, actual)
 
     def test_multiline_default(self):
         opt = config.Opt(
             'release_tag_re',
-            textwrap.dedent('''\
-            ((?:[\\d.ab]|rc)+)  # digits, a, b, and rc cover regular and
-                               # pre-releases
-            '''),
-            textwrap.dedent("""\
-            The regex pattern used to match the repo tags representing a
-            valid release version. The pattern is compiled with the
-            verbose and unicode flags enabled.
-            """),
+            _RELEASE_TAG_RE_DEFAULT,
+            _RELEASE_TAG_RE_HELP,
         )
         actual = '\n'.join(show_reno_config._format_option_help([opt]))
-        expected = textwrap.dedent("""\
-        ``release_tag_re``
-          The regex pattern used to match the repo tags representing a
-          valid release version. The pattern is compiled with the
-          verbose and unicode flags enabled.
-
-          Defaults to
-
-          ::
-
-            ((?:[\\d.ab]|rc)+)  # digits, a, b, and rc cover regular and
-                               # pre-releases
-        """)
-        self.assertEqual(expected, actual)
+        self.assertEqual(_MULTILINE_DEFAULT_EXPECTED, actual)
@@ -12,6 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import copy
 from unittest import mock
 
 from reno import config
@@ -20,6 +21,16 @@ from reno import loader
 from reno.tests import base
 
 
+_CONFIG_TEMPLATE = None
+
+
+def setUpModule():
+    # Reading the configuration is the same for every class in this
+    # module, so do it once and give each class its own copy.
+    global _CONFIG_TEMPLATE
+    _CONFIG_TEMPLATE = config.Config('reporoot')
+
+
 class TestFormatterBase(base.TestCase):
 
     scanner_output = {
@@ -29,32 +40,42 @@ class TestFormatterBase(base.TestCase):
 
     versions = ['0.0.0', '1.0.0']
 
-    def _get_note_body(self, reporoot, filename, sha):
-        return self.note_bodies.get(filename, '')
+    @classmethod
+    def setUpClass(cls):
+        super(TestFormatterBase, cls).setUpClass()
 
-    def setUp(self):
-        super(TestFormatterBase, self).setUp()
+        cls._cache = {
+            'file-contents': cls.note_bodies
+        }
 
         def _load(ldr):
-            ldr._scanner_output = self.scanner_output
-            ldr._cache = {
-                'file-contents': self.note_bodies
-            }
+            ldr._scanner_output = cls.scanner_output
+            ldr._cache = cls._cache
 
-        self.c = config.Config('reporoot')
+        # Build the loader once per class. Each test gets its own
+        # shallow copies in setUp() so that overrides do not leak
+        # between tests.
+        cls._config_template = copy.copy(_CONFIG_TEMPLATE)
 
         with mock.patch('reno.loader.Loader._load_data', _load):
-            self.ldr = loader.Loader(
-                self.c,
+            cls._loader_template = loader.Loader(
+                cls._config_template,
                 ignore_cache=False,
             )
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         # we don't need to worry about closing this after since we're not
         # actually using a real Git repo here (see the mock above), but we'll
         # do so to enforce the contract
-        self.ldr.close()
-        super().tearDown()
+        cls._loader_template.close()
+        super(TestFormatterBase, cls).tearDownClass()
+
+    def setUp(self):
+        super(TestFormatterBase, self).setUp()
+        self.c = copy.copy(self._config_template)
+        self.ldr = copy.copy(self._loader_template)
+        self.ldr._config = self.c
 
 
 class TestFormatter(TestFormatterBase):
@@ -77,41 +98,37 @@ class TestFormatter(TestFormatterBase):
         },
     }
 
-    def test_with_title(self):
-        result = formatter.format_report(
-            loader=self.ldr,
-            config=self.c,
-            versions_to_include=self.versions,
+    @classmethod
+    def setUpClass(cls):
+        super(TestFormatter, cls).setUpClass()
+        # None of these tests change the configuration, so each
+        # distinct report only needs to be built once.
+        cls.result_with_title = formatter.format_report(
+            loader=cls._loader_template,
+            config=cls._config_template,
+            versions_to_include=cls.versions,
             title='This is the title',
         )
-        self.assertIn('This is the title', result)
+        cls.result_without_title = formatter.format_report(
+            loader=cls._loader_template,
+            config=cls._config_template,
+            versions_to_include=cls.versions,
+            title=None,
+        )
+
+    def test_with_title(self):
+        self.assertIn('This is the title', self.result_with_title)
 
     def test_versions(self):
-        result = formatter.format_report(
-            loader=self.ldr,
-            config=self.c,
-            versions_to_include=self.versions,
-            title='This is the title',
-        )
+        result = self.result_with_title
         self.assertIn('0.0.0\n=====', result)
         self.assertIn('1.0.0\n=====', result)
 
     def test_without_title(self):
-        result = formatter.format_report(
-            loader=self.ldr,
-            config=self.c,
-            versions_to_include=self.versions,
-            title=None,
-        )
-        self.assertNotIn('This is the title', result)
+        self.assertNotIn('This is the title', self.result_without_title)
 
     def test_default_section_order(self):
-        result = formatter.format_report(
-            loader=self.ldr,
-            config=self.c,
-            versions_to_include=self.versions,
-            title=None,
-        )
+        result = self.result_without_title
         prelude_pos = result.index('This is the prelude.')
         issues_pos = result.index('This is the first issue.')
         features_pos = result.index('We added a feature!')
@@ -149,22 +166,24 @@ class TestFormatterCustomSections(TestFormatterBase):
         },
     }
 
-    def setUp(self):
-        super(TestFormatterCustomSections, self).setUp()
-        self.c.override(sections=[
+    @classmethod
+    def setUpClass(cls):
+        super(TestFormatterCustomSections, cls).setUpClass()
+        cls._config_template.override(sections=[
             ['features', 'New Features'],
             ['features_subsection', 'Subsection', 2],
             ['features_subsubsection', 'Subsubsection', 3],
             ['api', 'API Changes'],
         ])
-
-    def test_custom_section_order(self):
-        result = formatter.format_report(
-            loader=self.ldr,
-            config=self.c,
-            versions_to_include=self.versions,
+        cls.result = formatter.format_report(
+            loader=cls._loader_template,
+            config=cls._config_template,
+            versions_to_include=cls.versions,
             title=None,
         )
+
+    def test_custom_section_order(self):
+        result = self.result
         prelude_pos = result.index('This is the prelude.')
         api_pos = result.index('API Changes')
         features_pos = result.index('New Features')
@@ -182,12 +201,7 @@ class TestFormatterCustomSections(TestFormatterBase):
         self.assertIn('.. _relnotes_1.0.0_API Changes:', result)
 
     def test_header_underlines(self):
-        result = formatter.format_report(
-            loader=self.ldr,
-            config=self.c,
-            versions_to_include=self.versions,
-            title=None,
-        ).splitlines()
+        result = self.result.splitlines()
 
         def assert_header(header: str, char: str) -> None:
             pos = next(
@@ -240,6 +254,10 @@ class TestFormatterCustomUnreleaseTitle(TestFormatterBase):
 
 class TestFormatterAnchors(TestFormatterBase):
 
+    # The anchors are always complete lines, so the tests look them up
+    # in a set of the lines of the report instead of searching the
+    # whole text for each one.
+
     note_bodies = {
         'note1': {
             'prelude': 'This is the prelude.',
@@ -266,10 +284,11 @@ class TestFormatterAnchors(TestFormatterBase):
             versions_to_include=self.versions,
             title='This is the title',
         )
-        self.assertIn('.. _This is the title_0.0.0:', result)
-        self.assertIn('.. _This is the title_0.0.0_Prelude:', result)
-        self.assertIn('.. _This is the title_1.0.0:', result)
-        self.assertIn('.. _This is the title_1.0.0_Known Issues:', result)
+        lines = set(result.splitlines())
+        self.assertIn('.. _This is the title_0.0.0:', lines)
+        self.assertIn('.. _This is the title_0.0.0_Prelude:', lines)
+        self.assertIn('.. _This is the title_1.0.0:', lines)
+        self.assertIn('.. _This is the title_1.0.0_Known Issues:', lines)
 
     def test_without_title(self):
         result = formatter.format_report(
@@ -277,10 +296,11 @@ class TestFormatterAnchors(TestFormatterBase):
             config=self.c,
             versions_to_include=self.versions,
         )
-        self.assertIn('.. _relnotes_0.0.0:', result)
-        self.assertIn('.. _relnotes_0.0.0_Prelude:', result)
-        self.assertIn('.. _relnotes_1.0.0:', result)
-        self.assertIn('.. _relnotes_1.0.0_Known Issues:', result)
+        lines = set(result.splitlines())
+        self.assertIn('.. _relnotes_0.0.0:', lines)
+        self.assertIn('.. _relnotes_0.0.0_Prelude:', lines)
+        self.assertIn('.. _relnotes_1.0.0:', lines)
+        self.assertIn('.. _relnotes_1.0.0_Known Issues:', lines)
 
     def test_with_branch_and_title(self):
         self.c.override(unreleased_version_title='Not Released')
@@ -291,13 +311,14 @@ class TestFormatterAnchors(TestFormatterBase):
             title='This is the title',
             branch='stable/queens',
         )
-        self.assertIn('.. _This is the title_0.0.0_stable_queens:', result)
+        lines = set(result.splitlines())
+        self.assertIn('.. _This is the title_0.0.0_stable_queens:', lines)
         self.assertIn('.. _This is the title_0.0.0_stable_queens_Prelude:',
-                      result)
-        self.assertIn('.. _This is the title_1.0.0_stable_queens:', result)
+                      lines)
+        self.assertIn('.. _This is the title_1.0.0_stable_queens:', lines)
         self.assertIn(
             '.. _This is the title_1.0.0_stable_queens_Known Issues:',
-            result)
+            lines)
 
     def test_with_branch(self):
         result = formatter.format_report(
@@ -306,7 +327,8 @@ class TestFormatterAnchors(TestFormatterBase):
             versions_to_include=self.versions,
             branch='stable/queens',
         )
-        self.assertIn('.. _relnotes_0.0.0_stable_queens:', result)
-        self.assertIn('.. _relnotes_0.0.0_stable_queens_Prelude:', result)
-        self.assertIn('.. _relnotes_1.0.0_stable_queens:', result)
-        self.assertIn('.. _relnotes_1.0.0_stable_queens_Known Issues:', result)
+        lines = set(result.splitlines())
+        self.assertIn('.. _relnotes_0.0.0_stable_queens:', lines)
+        self.assertIn('.. _relnotes_0.0.0_stable_queens_Prelude:', lines)
+        self.assertIn('.. _relnotes_1.0.0_stable_queens:', lines)
+        self.assertIn('.. _relnotes_1.0.0_stable_queens_Known Issues:', lines)
@@ -12,6 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import copy
 import logging
 import textwrap
 from unittest import mock
@@ -23,6 +24,53 @@ from reno import config
 from reno import loader
 from reno.tests import base
 
+# Use the libyaml parser when it is available; it produces the same
+# results as the pure-Python one.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+_NON_PRELUDE_STRING = textwrap.dedent("""
+    issues: |
+      This is a single string. It should be converted to a list.
+    """)
+
+_PRELUDE_LIST = textwrap.dedent('''
+    prelude:
+      - The prelude should not be a list.
+    ''')
+
+_COLON_AS_DICT = textwrap.dedent('''
+    issues:
+      - This line is fine.
+      - dict: But this is parsed as a mapping (dictionary), which is bad.
+    ''')
+
+_UNRECOGNIZED_KEY = textwrap.dedent('''
+    foobar:
+    - |
+      This is an issue but we're using an unrecognized section key.
+    ''')
+
+_MISSING_KEY = textwrap.dedent('''
+    - |
+      This is an issue but we're missing the top-level 'issues' key.
+    ''')
+
+
+class _FakeLoader(loader.Loader):
+    """Loader that takes its data from the test instead of a repository."""
+
+    def __init__(self, conf, scanner_output, note_bodies):
+        self._fake_scanner_output = scanner_output
+        self._fake_note_bodies = note_bodies
+        super(_FakeLoader, self).__init__(conf, ignore_cache=False)
+
+    def _load_data(self):
+        self._scanner_output = self._fake_scanner_output
+        self._cache = {
+            'file-contents': {'note1': self._fake_note_bodies},
+        }
+
 
 class TestValidate(base.TestCase):
 
@@ -32,6 +80,20 @@ class TestValidate(base.TestCase):
 
     versions = ['0.0.0']
 
+    @classmethod
+    def setUpClass(cls):
+        super(TestValidate, cls).setUpClass()
+        # parse_note_file() does not modify its input, so the parsed
+        # notes can be shared by all of the tests.
+        cls.non_prelude_string = yaml.load(_NON_PRELUDE_STRING,
+                                           Loader=_YAML_LOADER)
+        cls.prelude_list = yaml.load(_PRELUDE_LIST, Loader=_YAML_LOADER)
+        cls.colon_as_dict = yaml.load(_COLON_AS_DICT, Loader=_YAML_LOADER)
+        cls.unrecognized_key = yaml.load(_UNRECOGNIZED_KEY,
+                                         Loader=_YAML_LOADER)
+        cls.missing_key = yaml.load(_MISSING_KEY, Loader=_YAML_LOADER)
+        cls._config_template = config.Config('reporoot')
+
     def setUp(self):
         super(TestValidate, self).setUp()
         self.logger = self.useFixture(
@@ -40,51 +102,31 @@ class TestValidate(base.TestCase):
                 level=logging.WARNING,
             )
         )
-        self.c = config.Config('reporoot')
+        self.c = copy.copy(self._config_template)
 
     def _make_loader(self, note_bodies):
-        def _load(ldr):
-            ldr._scanner_output = self.scanner_output
-            ldr._cache = {
-                'file-contents': {'note1': note_bodies},
-            }
-
-        with mock.patch('reno.loader.Loader._load_data', _load):
-            return loader.Loader(
-                self.c,
-                ignore_cache=False,
-            )
+        return _FakeLoader(self.c, self.scanner_output, note_bodies)
 
     def test_note_with_non_prelude_string_converted_to_list(self):
         """Test behavior when a non-prelude note is not structured as a list.
 
         We should silently convert it to list.
         """
-        note_bodies = yaml.safe_load(textwrap.dedent("""
-        issues: |
-          This is a single string. It should be converted to a list.
-        """))
+        note_bodies = self.non_prelude_string
         self.assertIsInstance(note_bodies['issues'], str)
         with self._make_loader(note_bodies) as ldr:
             parse_results = ldr.parse_note_file('note1', None)
         self.assertIsInstance(parse_results['issues'], list)
 
     def test_invalid_note_with_prelude_as_list(self):
-        note_bodies = yaml.safe_load(textwrap.dedent('''
-        prelude:
-          - The prelude should not be a list.
-        '''))
+        note_bodies = self.prelude_list
         self.assertIsInstance(note_bodies['prelude'], list)
         with self._make_loader(note_bodies) as ldr:
             ldr.parse_note_file('note1', None)
         self.assertIn('does not parse as a single string', self.logger.output)
 
     def test_invalid_note_with_colon_as_dict(self):
-        note_bodies = yaml.safe_load(textwrap.dedent('''
-        issues:
-          - This line is fine.
-          - dict: But this is parsed as a mapping (dictionary), which is bad.
-        '''))
+        note_bodies = self.colon_as_dict
         self.assertIsInstance(note_bodies['issues'][-1], dict)
         with self._make_loader(note_bodies) as ldr:
             ldr.parse_note_file('note1', None)
@@ -92,11 +134,7 @@ class TestValidate(base.TestCase):
 
     def test_invalid_note_with_unrecognized_key(self):
         """Test behavior when note contains an unrecognized section."""
-        note_bodies = yaml.safe_load(textwrap.dedent('''
-        foobar:
-        - |
-          This is an issue but we're using an unrecognized section key.
-        '''))
+        note_bodies = self.unrecognized_key
         self.assertIsInstance(note_bodies, dict)
         with self._make_loader(note_bodies) as ldr:
             ldr.parse_note_file('note1', None)
@@ -109,13 +147,31 @@ class TestValidate(base.TestCase):
 
         This one should be an error since we can't correct the input.
         """
-        note_bodies = yaml.safe_load(textwrap.dedent('''
-        - |
-          This is an issue but we're missing the top-level 'issues' key.
-        '''))
+        note_bodies = self.missing_key
         self.assertIsInstance(note_bodies, list)
         with self._make_loader(note_bodies) as ldr:
             self.assertRaises(ValueError, ldr.parse_note_file, 'note1', None)
         self.assertIn(
             'does not appear to be structured as a YAML mapping',
             self.logger.output)
+
+
+class TestCacheIsStale(base.SharedTempDirTestCase):
+
+    def setUp(self):
+        super(TestCacheIsStale, self).setUp()
+        self.c = config.Config(self.make_tmpdir())
+
+    def _make_loader(self, cache):
+        with mock.patch('reno.loader.Loader._load_data'):
+            ldr = loader.Loader(self.c)
+        ldr._cache = cache
+        return ldr
+
+    def test_no_recorded_head(self):
+        ldr = self._make_loader({'notes': []})
+        self.assertFalse(ldr._cache_is_stale())
+
+    def test_no_git_repository(self):
+        ldr = self._make_loader({'notes': [], 'head': '0' * 40})
+        self.assertFalse(ldr._cache_is_stale())
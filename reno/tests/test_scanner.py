@@ -12,22 +12,29 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import atexit
+import collections
 import itertools
 import logging
+import operator
 import os.path
 import re
+import shlex
+import shutil
 import subprocess
-import time
+import tempfile
 import unittest
-from unittest import mock
 
 from dulwich import diff_tree
 from dulwich import objects
+from dulwich import repo
 import fixtures
 from testtools.content import text_content
 
+from reno import cache
 from reno import config
 from reno import create
+from reno import loader
 from reno import scanner
 from reno.tests import base
 from reno import utils
@@ -56,40 +63,84 @@ packages =
 """
 
 
+_get_filename = operator.itemgetter(0)
+
+
+def _files_only(raw_results):
+    """Drop the SHAs from get_notes_by_version() results."""
+    return {
+        version: list(map(_get_filename, notes))
+        for (version, notes) in raw_results.items()
+    }
+
+
+_GNUPG_VERSION_RE = re.compile(r'^gpg\s.*\s(\d+)\.(\d+)\.(\d+)')
+
+# GnuPG home directory holding the key made by GPGKeyFixture. Generating
+# a key is slow, so it is only done once per test process.
+_GNUPG_HOME = None
+
+
+def _remove_gnupg_home(path):
+    try:
+        subprocess.call(
+            ['gpgconf', '--homedir', path, '--kill', 'gpg-agent'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        # GnuPG 1.x has no gpgconf and no agent to stop.
+        pass
+    shutil.rmtree(path, ignore_errors=True)
+
+
 class GPGKeyFixture(fixtures.Fixture):
-    """Creates a GPG key for testing.
+    """Provides a GPG key for testing.
 
-    It's recommended that this be used in concert with a unique home
-    directory.
+    The key is generated the first time the fixture is used and
+    shared by later tests, which point GNUPGHOME at it.
     """
 
     def setUp(self):
         super(GPGKeyFixture, self).setUp()
+        global _GNUPG_HOME
+        if _GNUPG_HOME is None:
+            gnupghome = tempfile.mkdtemp()
+            atexit.register(_remove_gnupg_home, gnupghome)
+            self._generate_key(gnupghome)
+            _GNUPG_HOME = gnupghome
+        self.useFixture(fixtures.EnvironmentVariable('GNUPGHOME',
+                                                     _GNUPG_HOME))
+
+    def _generate_key(self, gnupghome):
         tempdir = self.useFixture(fixtures.TempDir())
-        gnupg_version_re = re.compile(r'^gpg\s.*\s([\d+])\.([\d+])\.([\d+])')
-        gnupg_version = utils.check_output(['gpg', '--version'],
-                                           cwd=tempdir.path)
-        for line in gnupg_version.split('\n'):
-            gnupg_version = gnupg_version_re.match(line)
-            if gnupg_version:
-                gnupg_version = (int(gnupg_version.group(1)),
-                                 int(gnupg_version.group(2)),
-                                 int(gnupg_version.group(3)))
-                break
+        output = utils.check_output(['gpg', '--version'], cwd=tempdir.path)
+        match = next(
+            filter(None, map(_GNUPG_VERSION_RE.match, output.splitlines())),
+            None,
+        )
+        if match:
+            gnupg_version = tuple(int(g) for g in match.groups())
         else:
-            if gnupg_version is None:
-                gnupg_version = (0, 0, 0)
+            gnupg_version = (0, 0, 0)
         config_file = tempdir.path + '/key-config'
         f = open(config_file, 'wt')
         try:
             if gnupg_version[0] == 2 and gnupg_version[1] >= 1:
+                # ed25519 keys are much faster to generate than RSA
+                # keys, and GnuPG 2.1 is the first to support them.
                 f.write("""
                 %no-protection
                 %transient-key
+                Key-Type: EDDSA
+                Key-Curve: ed25519
+                """)
+            else:
+                f.write("""
+                Key-Type: RSA
                 """)
             f.write("""
             %no-ask-passphrase
-            Key-Type: RSA
             Name-Real: Example Key
             Name-Comment: N/A
             Name-Email: example@example.com
@@ -108,16 +159,15 @@ class GPGKeyFixture(fixtures.Fixture):
             gnupg_random = '--debug-quick-random'
         else:
             gnupg_random = ''
-        cmd = ['gpg', '--gen-key', '--batch']
+        cmd = ['gpg', '--homedir', gnupghome, '--gen-key', '--batch']
         if gnupg_random:
             cmd.append(gnupg_random)
         cmd.append(config_file)
         subprocess.check_call(
             cmd,
             cwd=tempdir.path,
-            # Direct stderr to its own pipe, from which we don't read,
-            # to quiet the commands.
-            stderr=subprocess.PIPE,
+            # Discard stderr to quiet the commands.
+            stderr=subprocess.DEVNULL,
         )
 
 
@@ -125,47 +175,101 @@ class GitRepoFixture(fixtures.Fixture):
 
     logger = logging.getLogger('git')
 
-    def __init__(self, reporoot):
+    def __init__(self, reporoot, sign=False, template=None):
         self.reporoot = reporoot
-
-        git_version_re = re.compile(r'^git version (\d+)\.(\d+)')
-        git_version_raw = utils.check_output(['git', '--version'])
-        git_version_match = git_version_re.match(git_version_raw)
-        self.git_version = (
-            int(git_version_match.group(1)),
-            int(git_version_match.group(2)),
-        )
-
+        self.sign = sign
+        self.template = template
         super(GitRepoFixture, self).__init__()
 
     def setUp(self):
         super(GitRepoFixture, self).setUp()
-        self.useFixture(GPGKeyFixture())
+        if self.sign:
+            self.useFixture(GPGKeyFixture())
+        if self.template is not None:
+            # Start from a copy of a repository saved by an earlier test.
+            shutil.copytree(self.template.path, self.reporoot, symlinks=True)
+            self._timestamps = itertools.count(self.template.timestamp)
+            return
+        # Give every git command its own timestamp, one second after
+        # the previous one, so commits and tags are ordered without
+        # having to sleep between them.
+        self._timestamps = itertools.count(1600000000)
         os.makedirs(self.reporoot)
-        if self.git_version > (2, 27):
-            # The branch defaults to `main` on modern Git.
-            self.git('init', '.', '--initial-branch', 'master')
-        else:
-            self.git('init', '.')
-        self.git('config', '--local', 'user.email', 'example@example.com')
-        self.git('config', '--local', 'user.name', 'reno developer')
-        self.git('config', '--local', 'user.signingkey',
-                 'example@example.com')
+        # Create and configure the repository in-process; only the
+        # commands that need gpg or the working tree run git itself.
+        r = repo.Repo.init(self.reporoot)
+        try:
+            # Newer git and dulwich may default to another branch name.
+            r.refs.set_symbolic_ref(b'HEAD', b'refs/heads/master')
+            conf = r.get_config()
+            conf.set((b'user',), b'email', b'example@example.com')
+            conf.set((b'user',), b'name', b'reno developer')
+            # Never stop to repack in the middle of a test.
+            conf.set((b'gc',), b'auto', b'0')
+            # The repository is thrown away after the test, so there
+            # is no need to flush objects and refs to disk. Older git
+            # ignores the setting.
+            conf.set((b'core',), b'fsync', b'none')
+            if self.sign:
+                conf.set((b'user',), b'signingkey', b'example@example.com')
+            conf.write_to_path()
+        finally:
+            r.close()
+
+    def _git_env(self):
+        date = '@%d +0000' % next(self._timestamps)
+        env = os.environ.copy()
+        env['GIT_AUTHOR_DATE'] = date
+        env['GIT_COMMITTER_DATE'] = date
+        # HOME is a fresh directory for each test; also keep the host's
+        # system-wide settings from leaking into the test repository.
+        env['GIT_CONFIG_NOSYSTEM'] = '1'
+        return env
 
     def git(self, *args):
         self.logger.debug('$ git %s', ' '.join(args))
         output = utils.check_output(
             ['git'] + list(args),
             cwd=self.reporoot,
+            env=self._git_env(),
         )
         self.logger.debug(output)
         return output
 
-    def commit(self, message='commit message'):
-        self.git('add', '.')
-        self.git('commit', '-m', message)
-        self.git('show', '--pretty=format:%H')
-        time.sleep(0.1)  # force a delay between commits
+    def git_batch(self, *commands):
+        """Run several git commands in one shell, stopping at the first error.
+
+        Each command is a sequence of arguments to git. Running them
+        together saves starting a separate process for each one.
+        """
+        script = ' && '.join(
+            ' '.join(shlex.quote(a) for a in ('git',) + tuple(cmd))
+            for cmd in commands
+        )
+        self.logger.debug('$ %s', script)
+        output = utils.check_output(
+            ['sh', '-c', script],
+            cwd=self.reporoot,
+            env=self._git_env(),
+        )
+        self.logger.debug(output)
+        return output
+
+    def commit(self, message='commit message', tag=None, tag_message=None):
+        """Commit all changes, optionally applying an annotated tag.
+
+        The tag is signed if the fixture was created with sign=True.
+        """
+        commands = [
+            ('add', '.'),
+            # Skip hooks, signing and the change summary, none of
+            # which the tests look at.
+            ('commit', '-q', '--no-verify', '--no-gpg-sign', '-m', message),
+        ]
+        if tag:
+            commands.append(
+                ('tag', '-s' if self.sign else '-a', '-m', tag_message, tag))
+        self.git_batch(*commands)
 
     def add_file(self, name):
         with open(os.path.join(self.reporoot, name), 'w') as f:
@@ -173,22 +277,94 @@ class GitRepoFixture(fixtures.Fixture):
         self.commit('add %s' % name)
 
 
+class _RepoTemplate(object):
+    """A saved copy of the repository built by Base.setUpRepo()."""
+
+    def __init__(self, test, attrs):
+        self._tmpdir = tempfile.mkdtemp(dir=base.scratch_root())
+        self.path = os.path.join(self._tmpdir, 'reporoot')
+        shutil.copytree(test.reporoot, self.path, symlinks=True)
+        # Record where the counters are without consuming values the
+        # test that built the repository might still use.
+        self.timestamp = next(test.repo._timestamps)
+        test.repo._timestamps = itertools.count(self.timestamp)
+        self.note_num = next(test._counter)
+        test._counter = itertools.count(self.note_num)
+        self.attrs = attrs
+
+    def remove(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+
 class Base(base.TestCase):
 
     logger = logging.getLogger('test')
 
+    # Most tests only need annotated tags. Classes that want real
+    # signed tags set this, at the cost of a GPG key.
+    sign_tags = False
+
+    # Classes whose tests all start from the same history build it in
+    # a setUpRepo() method. The first test in the class builds it and
+    # the others start from a copy.
+    setUpRepo = None
+
+    # Classes whose tests only read the saved repository through
+    # _get_shared_scanner() turn this off to skip copying it for
+    # each test.
+    copy_repo_template = True
+
+    @classmethod
+    def tearDownClass(cls):
+        shared_scanner = cls.__dict__.get('_shared_scanner')
+        if shared_scanner is not None:
+            shared_scanner.close()
+            del cls._shared_scanner
+        template = cls.__dict__.get('_repo_template')
+        if template is not None:
+            template.remove()
+            del cls._repo_template
+        super(Base, cls).tearDownClass()
+
+    def _get_shared_scanner(self):
+        """Return a Scanner on the saved copy of the class's repository.
+
+        The Scanner is shared by all of the tests in the class, so it
+        is only suitable for tests that do not change the repository
+        or the configuration.
+        """
+        cls = type(self)
+        shared_scanner = cls.__dict__.get('_shared_scanner')
+        if shared_scanner is None:
+            shared_scanner = scanner.Scanner(
+                config.Config(cls._repo_template.path))
+            cls._shared_scanner = shared_scanner
+        return shared_scanner
+
     def _add_notes_file(self, slug='slug', commit=True, legacy=False,
-                        contents='i-am-also-a-template'):
+                        contents='i-am-also-a-template', tag=None,
+                        tag_message=None):
         n = self.get_note_num()
         if legacy:
             basename = '%016x-%s.yaml' % (n, slug)
         else:
             basename = '%s-%016x.yaml' % (slug, n)
-        filename = os.path.join(self.reporoot, 'releasenotes', 'notes',
-                                basename)
-        create._make_note_file(filename, contents)
-        self.repo.commit('add %s' % basename)
-        return os.path.join('releasenotes', 'notes', basename)
+        relname = os.path.join('releasenotes', 'notes', basename)
+        create._make_note_file(os.path.join(self.reporoot, relname),
+                               contents)
+        if commit:
+            self.repo.commit('add %s' % basename, tag, tag_message)
+        return relname
+
+    def _add_git_detail(self, name, *args):
+        """Attach the output of a git command to the test if it fails.
+
+        The command is only run when the test fails, at which point
+        the repository is still in place.
+        """
+        self.addOnException(
+            lambda exc_info: self.addDetail(
+                name, text_content(self.repo.git(*args))))
 
     def _make_python_package(self):
         setup_name = os.path.join(self.reporoot, 'setup.py')
@@ -213,17 +389,39 @@ class Base(base.TestCase):
                 nuke_handlers=True,
             )
         )
+        # Keep the repository on tmpfs when there is one, since the
+        # tests write many small files.
+        scratch = base.scratch_root()
         # Older git does not have config --local, so create a temporary home
         # directory to permit using git config --global without stepping on
         # developer configuration.
-        self.useFixture(fixtures.TempHomeDir())
+        self.useFixture(fixtures.TempHomeDir(rootdir=scratch))
         self.useFixture(fixtures.NestedTempfile())
-        self.temp_dir = self.useFixture(fixtures.TempDir()).path
+        self.temp_dir = self.useFixture(fixtures.TempDir(rootdir=scratch)).path
         self.reporoot = os.path.join(self.temp_dir, 'reporoot')
-        self.repo = self.useFixture(GitRepoFixture(self.reporoot))
-        self.c = config.Config(self.reporoot)
         self._counter = itertools.count(1)
         self.get_note_num = lambda: next(self._counter)
+        # Look only at this class, so subclasses build their own.
+        template = type(self).__dict__.get('_repo_template')
+        if template is not None and not self.copy_repo_template:
+            # Point at the saved copy, which the shared scanner reads.
+            self.reporoot = template.path
+            self.__dict__.update(template.attrs)
+            self.c = config.Config(self.reporoot)
+            return
+        self.repo = self.useFixture(
+            GitRepoFixture(self.reporoot, sign=self.sign_tags,
+                           template=template))
+        if template is not None:
+            self._counter = itertools.count(template.note_num)
+            self.__dict__.update(template.attrs)
+        elif self.setUpRepo is not None:
+            before = set(self.__dict__)
+            self.setUpRepo()
+            attrs = {k: v for k, v in self.__dict__.items()
+                     if k not in before}
+            type(self)._repo_template = _RepoTemplate(self, attrs)
+        self.c = config.Config(self.reporoot)
 
 
 class BasicTest(Base):
@@ -232,24 +430,30 @@ class BasicTest(Base):
         filename = self._add_notes_file()
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'0.0.0': [filename]},
             results,
         )
 
+    def test_unknown_branch_no_tags(self):
+        # A misspelled branch is reported even when the repository
+        # has no tags to find.
+        self._add_notes_file()
+        self.c.override(
+            branch='stable/1',
+            earliest_version='1.0.0',
+        )
+        with scanner.Scanner(self.c) as s:
+            e = self.assertRaises(ValueError, s.get_notes_by_version)
+        self.assertIn("Unknown reference 'stable/1'", str(e))
+
     def test_python_no_tags(self):
         self._make_python_package()
         filename = self._add_notes_file()
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'0.0.0': [filename]},
             results,
@@ -258,41 +462,31 @@ class BasicTest(Base):
     def test_note_before_tag(self):
         filename = self._add_notes_file()
         self.repo.add_file('not-a-release-note.txt')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [filename]},
             results,
         )
 
     def test_note_commit_tagged(self):
-        filename = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        filename = self._add_notes_file(tag='1.0.0', tag_message='first tag')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [filename]},
             results,
         )
 
     def test_tag_with_v_prefix(self):
-        filename = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'tag with v prefix', 'v1.0.0')
+        filename = self._add_notes_file(tag='v1.0.0',
+                                        tag_message='tag with v prefix')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'v1.0.0': [filename]},
             results,
@@ -300,14 +494,11 @@ class BasicTest(Base):
 
     def test_note_commit_after_tag(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         filename = self._add_notes_file()
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0-1': [filename]},
             results,
@@ -315,15 +506,12 @@ class BasicTest(Base):
 
     def test_note_commit_after_double_tag(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0rc1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0rc1')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         filename = self._add_notes_file()
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0-1': [filename]},
             results,
@@ -332,14 +520,11 @@ class BasicTest(Base):
     def test_other_commit_after_tag(self):
         filename = self._add_notes_file()
         self.repo.add_file('ignore-1.txt')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         self.repo.add_file('ignore-2.txt')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [filename]},
             results,
@@ -347,15 +532,12 @@ class BasicTest(Base):
 
     def test_multiple_notes_after_tag(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         f1 = self._add_notes_file()
         f2 = self._add_notes_file()
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0-2': [f1, f2]},
             results,
@@ -364,14 +546,10 @@ class BasicTest(Base):
     def test_multiple_notes_within_tag(self):
         self._make_python_package()
         f1 = self._add_notes_file(commit=False)
-        f2 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        f2 = self._add_notes_file(tag='1.0.0', tag_message='first tag')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [f1, f2]},
             results,
@@ -379,16 +557,12 @@ class BasicTest(Base):
 
     def test_multiple_tags(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f1 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
+        f1 = self._add_notes_file(tag='2.0.0', tag_message='first tag')
         f2 = self._add_notes_file()
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'2.0.0': [f1],
              '2.0.0-1': [f2],
@@ -396,126 +570,17 @@ class BasicTest(Base):
             results,
         )
 
-    def test_rename_file(self):
-        self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        f2 = f1.replace('slug1', 'slug2')
-        self.repo.git('mv', f1, f2)
-        self.repo.commit('rename note file')
-        with scanner.Scanner(self.c) as s:
-            raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
-        self.assertEqual(
-            {'2.0.0': [f2],
-             },
-            results,
-        )
-
-    def test_rename_file_sort_earlier(self):
-        self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        f2 = f1.replace('slug1', 'slug0')
-        self.repo.git('mv', f1, f2)
-        self.repo.commit('rename note file')
-        with scanner.Scanner(self.c) as s:
-            raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
-        self.assertEqual(
-            {'2.0.0': [f2],
-             },
-            results,
-        )
-
-    def test_edit_file(self):
-        self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f1 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        with open(os.path.join(self.reporoot, f1), 'w') as f:
-            f.write('---\npreamble: new contents for file')
-        self.repo.commit('edit note file')
-        with scanner.Scanner(self.c) as s:
-            raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
-        self.assertEqual(
-            {'2.0.0': [f1],
-             },
-            results,
-        )
-
-    def test_legacy_file(self):
-        self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f1 = self._add_notes_file('slug1', legacy=True)
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        f2 = f1.replace('slug1', 'slug2')
-        self.repo.git('mv', f1, f2)
-        self.repo.commit('rename note file')
-        with scanner.Scanner(self.c) as s:
-            raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
-        self.assertEqual(
-            {'2.0.0': [f2],
-             },
-            results,
-        )
-
-    def test_rename_legacy_file_to_new(self):
-        self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f1 = self._add_notes_file('slug1', legacy=True)
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        # Rename the file with the new convention of placing the UUID
-        # after the slug instead of before.
-        f2 = f1.replace('0000000000000001-slug1',
-                        'slug1-0000000000000001')
-        self.repo.git('mv', f1, f2)
-        self.repo.commit('rename note file')
-        with scanner.Scanner(self.c) as s:
-            raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
-        self.assertEqual(
-            {'2.0.0': [f2],
-             },
-            results,
-        )
-
     def test_limit_by_earliest_version(self):
         self._make_python_package()
-        self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f2 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'middle tag', '2.0.0')
-        f3 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'last tag', '3.0.0')
+        self._add_notes_file(tag='1.0.0', tag_message='first tag')
+        f2 = self._add_notes_file(tag='2.0.0', tag_message='middle tag')
+        f3 = self._add_notes_file(tag='3.0.0', tag_message='last tag')
         self.c.override(
             earliest_version='2.0.0',
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'2.0.0': [f2],
              '3.0.0': [f3],
@@ -523,59 +588,11 @@ class BasicTest(Base):
             results,
         )
 
-    def test_delete_file(self):
-        self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f1 = self._add_notes_file('slug1')
-        f2 = self._add_notes_file('slug2')
-        self.repo.git('rm', f1)
-        self.repo.commit('remove note file')
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        with scanner.Scanner(self.c) as s:
-            raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
-        self.assertEqual(
-            {'2.0.0': [f2],
-             },
-            results,
-        )
-
-    def test_rename_then_delete_file(self):
-        self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f1 = self._add_notes_file('slug1')
-        f2 = f1.replace('slug1', 'slug2')
-        self.repo.git('mv', f1, f2)
-        self.repo.git('status')
-        self.repo.commit('rename note file')
-        self.repo.git('rm', f2)
-        self.repo.commit('remove note file')
-        f3 = self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        log_results = self.repo.git('log', '--topo-order',
-                                    '--pretty=%H %d',
-                                    '--name-only')
-        self.addDetail('git log', text_content(log_results))
-        with scanner.Scanner(self.c) as s:
-            raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
-        self.assertEqual(
-            {'2.0.0': [f3],
-             },
-            results,
-        )
-
     def test_staged_file(self):
         # Prove that we can get a file we have staged.
         # Start with a standard commit and tag
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         # Now stage a release note
         n = self.get_note_num()
         basename = 'staged-note-%016x.yaml' % n
@@ -583,8 +600,7 @@ class BasicTest(Base):
                                 basename)
         create._make_note_file(filename, 'staged note')
         self.repo.git('add', filename)
-        status_results = self.repo.git('status')
-        self.addDetail('git status', text_content(status_results))
+        self._add_git_detail('git status', 'status')
         # Now run the scanner
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
@@ -601,15 +617,14 @@ class BasicTest(Base):
         # Prove that we can get a file we have created but not staged.
         # Start with a standard commit and tag
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         # Now create a note without staging it
         n = self.get_note_num()
         basename = 'staged-note-%016x.yaml' % n
         filename = os.path.join(self.reporoot, 'releasenotes', 'notes',
                                 basename)
         create._make_note_file(filename, 'staged note')
-        status_results = self.repo.git('status')
-        self.addDetail('git status', text_content(status_results))
+        self._add_git_detail('git status', 'status')
         # Now run the scanner
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
@@ -627,14 +642,13 @@ class BasicTest(Base):
         # Prove that we can get a file we have changed but not staged.
         # Start with a standard commit and tag
         self._make_python_package()
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        f1 = self._add_notes_file('slug1', tag='1.0.0',
+                                  tag_message='first tag')
         # Now modify the note
         fullpath = os.path.join(self.repo.reporoot, f1)
         with open(fullpath, 'w') as f:
             f.write('modified first note')
-        status_results = self.repo.git('status')
-        self.addDetail('git status', text_content(status_results))
+        self._add_git_detail('git status', 'status')
         # Now run the scanner
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
@@ -649,12 +663,9 @@ class BasicTest(Base):
 
     def test_stop_on_master_with_other_branch(self):
         self._make_python_package()
-        self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'middle tag', '2.0.0')
-        f3 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'last tag', '3.0.0')
+        self._add_notes_file(tag='1.0.0', tag_message='first tag')
+        self._add_notes_file(tag='2.0.0', tag_message='middle tag')
+        f3 = self._add_notes_file(tag='3.0.0', tag_message='last tag')
         self.repo.git('branch', 'stable/a')
         f4 = self._add_notes_file()
         self.c.override(
@@ -662,10 +673,7 @@ class BasicTest(Base):
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'3.0.0-1': [f4],
              '3.0.0': [f3],
@@ -675,22 +683,16 @@ class BasicTest(Base):
 
     def test_stop_on_master_without_limits_or_branches(self):
         self._make_python_package()
-        f1 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        f2 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'middle tag', '2.0.0')
-        f3 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'last tag', '3.0.0')
+        f1 = self._add_notes_file(tag='1.0.0', tag_message='first tag')
+        f2 = self._add_notes_file(tag='2.0.0', tag_message='middle tag')
+        f3 = self._add_notes_file(tag='3.0.0', tag_message='last tag')
         f4 = self._add_notes_file()
         self.c.override(
             earliest_version=None,
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'3.0.0-1': [f4],
              '3.0.0': [f3],
@@ -701,11 +703,136 @@ class BasicTest(Base):
         )
 
 
+class FileManipulationTest(Base):
+
+    def setUpRepo(self):
+        self._make_python_package()
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
+
+    def test_rename_file(self):
+        f1 = self._add_notes_file('slug1', tag='2.0.0',
+                                  tag_message='first tag')
+        f2 = f1.replace('slug1', 'slug2')
+        self.repo.git('mv', f1, f2)
+        self.repo.commit('rename note file')
+        with scanner.Scanner(self.c) as s:
+            raw_results = s.get_notes_by_version()
+        results = _files_only(raw_results)
+        self.assertEqual(
+            {'2.0.0': [f2],
+             },
+            results,
+        )
+
+    def test_rename_file_sort_earlier(self):
+        f1 = self._add_notes_file('slug1', tag='2.0.0',
+                                  tag_message='first tag')
+        f2 = f1.replace('slug1', 'slug0')
+        self.repo.git('mv', f1, f2)
+        self.repo.commit('rename note file')
+        with scanner.Scanner(self.c) as s:
+            raw_results = s.get_notes_by_version()
+        results = _files_only(raw_results)
+        self.assertEqual(
+            {'2.0.0': [f2],
+             },
+            results,
+        )
+
+    def test_edit_file(self):
+        f1 = self._add_notes_file(tag='2.0.0', tag_message='first tag')
+        with open(os.path.join(self.reporoot, f1), 'w') as f:
+            f.write('---\npreamble: new contents for file')
+        self.repo.commit('edit note file')
+        with scanner.Scanner(self.c) as s:
+            raw_results = s.get_notes_by_version()
+        results = _files_only(raw_results)
+        self.assertEqual(
+            {'2.0.0': [f1],
+             },
+            results,
+        )
+
+    def test_legacy_file(self):
+        f1 = self._add_notes_file('slug1', legacy=True, tag='2.0.0',
+                                  tag_message='first tag')
+        f2 = f1.replace('slug1', 'slug2')
+        self.repo.git('mv', f1, f2)
+        self.repo.commit('rename note file')
+        with scanner.Scanner(self.c) as s:
+            raw_results = s.get_notes_by_version()
+        results = _files_only(raw_results)
+        self.assertEqual(
+            {'2.0.0': [f2],
+             },
+            results,
+        )
+
+    def test_rename_legacy_file_to_new(self):
+        f1 = self._add_notes_file('slug1', legacy=True, tag='2.0.0',
+                                  tag_message='first tag')
+        # Rename the file with the new convention of placing the UUID
+        # after the slug instead of before.
+        f2 = f1.replace('0000000000000001-slug1',
+                        'slug1-0000000000000001')
+        self.repo.git('mv', f1, f2)
+        self.repo.commit('rename note file')
+        with scanner.Scanner(self.c) as s:
+            raw_results = s.get_notes_by_version()
+        results = _files_only(raw_results)
+        self.assertEqual(
+            {'2.0.0': [f2],
+             },
+            results,
+        )
+
+    def test_delete_file(self):
+        f1 = self._add_notes_file('slug1')
+        f2 = self._add_notes_file('slug2')
+        self.repo.git_batch(
+            ('rm', '-q', f1),
+            ('commit', '-q', '--no-verify', '--no-gpg-sign',
+             '-m', 'remove note file'),
+        )
+        self.repo.git('tag', '-a', '-m', 'first tag', '2.0.0')
+        with scanner.Scanner(self.c) as s:
+            raw_results = s.get_notes_by_version()
+        results = _files_only(raw_results)
+        self.assertEqual(
+            {'2.0.0': [f2],
+             },
+            results,
+        )
+
+    def test_rename_then_delete_file(self):
+        f1 = self._add_notes_file('slug1')
+        f2 = f1.replace('slug1', 'slug2')
+        self.repo.git('mv', f1, f2)
+        self.repo.commit('rename note file')
+        self.repo.git_batch(
+            ('rm', '-q', f2),
+            ('commit', '-q', '--no-verify', '--no-gpg-sign',
+             '-m', 'remove note file'),
+        )
+        f3 = self._add_notes_file('slug3', tag='2.0.0',
+                                  tag_message='first tag')
+        self._add_git_detail('git log', 'log', '--topo-order',
+                             '--pretty=%H %d', '--name-only')
+        with scanner.Scanner(self.c) as s:
+            raw_results = s.get_notes_by_version()
+        results = _files_only(raw_results)
+        self.assertEqual(
+            {'2.0.0': [f3],
+             },
+            results,
+        )
+
+
 class IgnoreTest(Base):
 
     def test_by_fullname(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         f1 = self._add_notes_file()
         f2 = self._add_notes_file()
         self.c.override(
@@ -713,10 +840,7 @@ class IgnoreTest(Base):
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0-2': [f2]},
             results,
@@ -724,7 +848,7 @@ class IgnoreTest(Base):
 
     def test_by_basename(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         f1 = self._add_notes_file()
         f2 = self._add_notes_file()
         self.c.override(
@@ -732,10 +856,7 @@ class IgnoreTest(Base):
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0-2': [f2]},
             results,
@@ -743,7 +864,7 @@ class IgnoreTest(Base):
 
     def test_by_uid(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         f1 = self._add_notes_file()
         f2 = self._add_notes_file()
         self.c.override(
@@ -751,10 +872,7 @@ class IgnoreTest(Base):
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0-2': [f2]},
             results,
@@ -762,7 +880,7 @@ class IgnoreTest(Base):
 
     def test_by_multiples(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0')
         f1 = self._add_notes_file()
         f2 = self._add_notes_file()
         self.c.override(
@@ -773,10 +891,7 @@ class IgnoreTest(Base):
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {},
             results,
@@ -867,15 +982,12 @@ class PreReleaseTest(Base):
 
     def test_alpha(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0.0a1')
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0.0a2')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0.0a1')
+        f1 = self._add_notes_file('slug1', tag='1.0.0.0a2',
+                                  tag_message='first tag')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0.0a2': [f1],
              },
@@ -884,15 +996,12 @@ class PreReleaseTest(Base):
 
     def test_beta(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0.0b1')
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0.0b2')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0.0b1')
+        f1 = self._add_notes_file('slug1', tag='1.0.0.0b2',
+                                  tag_message='first tag')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0.0b2': [f1],
              },
@@ -901,15 +1010,12 @@ class PreReleaseTest(Base):
 
     def test_release_candidate(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0.0rc1')
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0.0rc2')
+        self.repo.git('tag', '-a', '-m', 'first tag', '1.0.0.0rc1')
+        f1 = self._add_notes_file('slug1', tag='1.0.0.0rc2',
+                                  tag_message='first tag')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0.0rc2': [f1],
              },
@@ -918,15 +1024,12 @@ class PreReleaseTest(Base):
 
     def test_tag_with_v_prefix(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'first tag', 'v1.0.0.0a1')
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', 'v1.0.0.0a2')
+        self.repo.git('tag', '-a', '-m', 'first tag', 'v1.0.0.0a1')
+        f1 = self._add_notes_file('slug1', tag='v1.0.0.0a2',
+                                  tag_message='first tag')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'v1.0.0.0a2': [f1],
              },
@@ -937,22 +1040,19 @@ class PreReleaseTest(Base):
         files = []
         self._make_python_package()
         files.append(self._add_notes_file('slug1'))
-        self.repo.git('tag', '-s', '-m', 'alpha tag', '1.0.0.0a1')
+        self.repo.git('tag', '-a', '-m', 'alpha tag', '1.0.0.0a1')
         files.append(self._add_notes_file('slug2'))
-        self.repo.git('tag', '-s', '-m', 'beta tag', '1.0.0.0b1')
+        self.repo.git('tag', '-a', '-m', 'beta tag', '1.0.0.0b1')
         files.append(self._add_notes_file('slug3'))
-        self.repo.git('tag', '-s', '-m', 'release candidate tag', '1.0.0.0rc1')
+        self.repo.git('tag', '-a', '-m', 'release candidate tag', '1.0.0.0rc1')
         files.append(self._add_notes_file('slug4'))
-        self.repo.git('tag', '-s', '-m', 'full release tag', '1.0.0')
+        self.repo.git('tag', '-a', '-m', 'full release tag', '1.0.0')
         self.c.override(
             collapse_pre_releases=True,
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': files,
              },
@@ -961,21 +1061,18 @@ class PreReleaseTest(Base):
 
     def test_collapse_without_full_release(self):
         self._make_python_package()
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'alpha tag', '1.0.0.0a1')
-        f2 = self._add_notes_file('slug2')
-        self.repo.git('tag', '-s', '-m', 'beta tag', '1.0.0.0b1')
-        f3 = self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'release candidate tag', '1.0.0.0rc1')
+        f1 = self._add_notes_file('slug1', tag='1.0.0.0a1',
+                                  tag_message='alpha tag')
+        f2 = self._add_notes_file('slug2', tag='1.0.0.0b1',
+                                  tag_message='beta tag')
+        f3 = self._add_notes_file('slug3', tag='1.0.0.0rc1',
+                                  tag_message='release candidate tag')
         self.c.override(
             collapse_pre_releases=True,
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0.0a1': [f1],
              '1.0.0.0b1': [f2],
@@ -986,22 +1083,19 @@ class PreReleaseTest(Base):
 
     def test_collapse_without_notes(self):
         self._make_python_package()
-        self.repo.git('tag', '-s', '-m', 'earlier tag', '0.1.0')
-        f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'alpha tag', '1.0.0.0a1')
-        f2 = self._add_notes_file('slug2')
-        self.repo.git('tag', '-s', '-m', 'beta tag', '1.0.0.0b1')
-        f3 = self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'release candidate tag', '1.0.0.0rc1')
+        self.repo.git('tag', '-a', '-m', 'earlier tag', '0.1.0')
+        f1 = self._add_notes_file('slug1', tag='1.0.0.0a1',
+                                  tag_message='alpha tag')
+        f2 = self._add_notes_file('slug2', tag='1.0.0.0b1',
+                                  tag_message='beta tag')
+        f3 = self._add_notes_file('slug3', tag='1.0.0.0rc1',
+                                  tag_message='release candidate tag')
         self.c.override(
             collapse_pre_releases=True,
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0.0a1': [f1],
              '1.0.0.0b1': [f2],
@@ -1016,23 +1110,18 @@ class MergeCommitTest(Base):
     def test_1(self):
         # Create changes on master and in the branch
         # in order so the history is "normal"
-        n1 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        n1 = self._add_notes_file(tag='1.0.0', tag_message='first tag')
         self.repo.git('checkout', '-b', 'test_merge_commit')
         n2 = self._add_notes_file()
         self.repo.git('checkout', 'master')
         self.repo.add_file('ignore-1.txt')
         # Merge the branch into master.
         self.repo.git('merge', '--no-ff', 'test_merge_commit')
-        time.sleep(0.1)  # force a delay between commits
         self.repo.add_file('ignore-2.txt')
-        self.repo.git('tag', '-s', '-m', 'second tag', '2.0.0')
+        self.repo.git('tag', '-a', '-m', 'second tag', '2.0.0')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [n1],
              '2.0.0': [n2]},
@@ -1050,21 +1139,16 @@ class MergeCommitTest(Base):
         self.repo.git('checkout', '-b', 'test_merge_commit')
         n1 = self._add_notes_file()
         self.repo.git('checkout', 'master')
-        n2 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        n2 = self._add_notes_file(tag='1.0.0', tag_message='first tag')
         self.repo.add_file('ignore-1.txt')
         # Merge the branch into master.
         self.repo.git('merge', '--no-ff', 'test_merge_commit')
-        time.sleep(0.1)  # force a delay between commits
         self.repo.git('show')
         self.repo.add_file('ignore-2.txt')
-        self.repo.git('tag', '-s', '-m', 'second tag', '2.0.0')
+        self.repo.git('tag', '-a', '-m', 'second tag', '2.0.0')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [n2],
              '2.0.0': [n1]},
@@ -1084,21 +1168,16 @@ class MergeCommitTest(Base):
         self.repo.git('checkout', '-b', 'test_merge_commit')
         n1 = self._add_notes_file()
         self.repo.git('checkout', 'master')
-        n2 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        n2 = self._add_notes_file(tag='1.0.0', tag_message='first tag')
         self.repo.add_file('ignore-1.txt')
-        self.repo.git('tag', '-s', '-m', 'second tag', '1.1.0')
+        self.repo.git('tag', '-a', '-m', 'second tag', '1.1.0')
         self.repo.git('merge', '--no-ff', 'test_merge_commit')
-        time.sleep(0.1)  # force a delay between commits
         self.repo.add_file('ignore-2.txt')
-        self.repo.git('tag', '-s', '-m', 'third tag', '2.0.0')
+        self.repo.git('tag', '-a', '-m', 'third tag', '2.0.0')
         self.repo.add_file('ignore-3.txt')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         # Since the 1.1.0 tag has no notes files, it does not appear
         # in the output. It's only there to trigger the bug as it was
         # originally reported.
@@ -1121,22 +1200,16 @@ class MergeCommitTest(Base):
         self.repo.git('checkout', '-b', 'test_merge_commit')
         n1 = self._add_notes_file()
         self.repo.git('checkout', 'master')
-        n2 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        n2 = self._add_notes_file(tag='1.0.0', tag_message='first tag')
         self.repo.add_file('ignore-1.txt')
-        n3 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'second tag', '1.1.0')
+        n3 = self._add_notes_file(tag='1.1.0', tag_message='second tag')
         self.repo.git('merge', '--no-ff', 'test_merge_commit')
-        time.sleep(0.1)  # force a delay between commits
         self.repo.add_file('ignore-2.txt')
-        self.repo.git('tag', '-s', '-m', 'third tag', '2.0.0')
+        self.repo.git('tag', '-a', '-m', 'third tag', '2.0.0')
         self.repo.add_file('ignore-3.txt')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [n2],
              '1.1.0': [n3],
@@ -1153,14 +1226,16 @@ class NullMergeTest(Base):
 
     def setUp(self):
         super(NullMergeTest, self).setUp()
+        self._add_git_detail('git log', 'log', '--decorate', '--oneline',
+                             '--graph', '--all')
+
+    def setUpRepo(self):
         self.repo.add_file('ignore-0.txt')
-        self.n1 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.n1 = self._add_notes_file(tag='1.0.0', tag_message='first tag')
 
         # Create a branch, add a note, and tag it.
         self.repo.git('checkout', '-b', 'test_ignore_null_merge')
-        self.n2 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'second tag', '2.0.0')
+        self.n2 = self._add_notes_file(tag='2.0.0', tag_message='second tag')
 
         # Move back to master and advance it.
         self.repo.git('checkout', 'master')
@@ -1173,10 +1248,8 @@ class NullMergeTest(Base):
         )
 
         # Add another note file.
-        self.n4 = self._add_notes_file()
-        self.repo.git('tag', '-s', '-m', 'third tag', '3.0.0')
+        self.n4 = self._add_notes_file(tag='3.0.0', tag_message='third tag')
 
-        self.repo.git('log', '--decorate', '--oneline', '--graph', '--all')
         # The results should look like:
         #
         # * afea344 (HEAD -> master, tag: 3.0.0) add slug-0000000000000004.yaml
@@ -1195,10 +1268,7 @@ class NullMergeTest(Base):
         # the base of the previous branch.
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [self.n1],
              '3.0.0': [self.n3, self.n4]},
@@ -1214,10 +1284,7 @@ class NullMergeTest(Base):
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {'1.0.0': [self.n1],
              '2.0.0': [self.n2, self.n3],
@@ -1225,6 +1292,28 @@ class NullMergeTest(Base):
             results,
         )
 
+    def test_ignore_stop_point_on_merged_branch(self):
+        # The scan stop point for stable/3 is the base of stable/2,
+        # which is the 2.0.0 tag that was null-merged into master.
+        # The scan skips that commit, so it has to keep going past it
+        # to the earliest version.
+        self.repo.git('branch', 'stable/2', 'test_ignore_null_merge')
+        self.repo.git('checkout', '-b', 'stable/3')
+        n5 = self._add_notes_file(tag='3.0.1', tag_message='stable tag')
+        self.c.override(
+            branch='stable/3',
+            earliest_version='1.0.0',
+        )
+        with scanner.Scanner(self.c) as s:
+            raw_results = s.get_notes_by_version()
+        results = _files_only(raw_results)
+        self.assertEqual(
+            {'1.0.0': [self.n1],
+             '3.0.0': [self.n3, self.n4],
+             '3.0.1': [n5]},
+            results,
+        )
+
 
 class UniqueIdTest(Base):
 
@@ -1245,18 +1334,15 @@ class BranchBaseTest(Base):
 
     def setUp(self):
         super(BranchBaseTest, self).setUp()
-        self._make_python_package()
-        self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        self._add_notes_file('slug2')
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'first tag', '3.0.0')
-        self.repo.git('checkout', '2.0.0')
-        self.repo.git('branch', 'not-master')
-        self.repo.git('checkout', 'master')
         self.scanner = scanner.Scanner(self.c)
 
+    def setUpRepo(self):
+        self._make_python_package()
+        self._add_notes_file('slug1', tag='1.0.0', tag_message='first tag')
+        self._add_notes_file('slug2', tag='2.0.0', tag_message='first tag')
+        self._add_notes_file('slug3', tag='3.0.0', tag_message='first tag')
+        self.repo.git('branch', 'not-master', '2.0.0')
+
     def tearDown(self):
         self.scanner.close()
         super().tearDown()
@@ -1317,28 +1403,22 @@ class BranchBaseTest(Base):
 
 class BranchTest(Base):
 
-    def setUp(self):
-        super(BranchTest, self).setUp()
+    def setUpRepo(self):
         self._make_python_package()
-        self.f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        self.f2 = self._add_notes_file('slug2')
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        self.f3 = self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'first tag', '3.0.0')
+        self.f1 = self._add_notes_file('slug1', tag='1.0.0',
+                                       tag_message='first tag')
+        self.f2 = self._add_notes_file('slug2', tag='2.0.0',
+                                       tag_message='first tag')
+        self.f3 = self._add_notes_file('slug3', tag='3.0.0',
+                                       tag_message='first tag')
 
     def test_files_current_branch(self):
-        self.repo.git('checkout', '2.0.0')
-        self.repo.git('checkout', '-b', 'stable/2')
+        self.repo.git('checkout', '-b', 'stable/2', '2.0.0')
         f21 = self._add_notes_file('slug21')
-        log_text = self.repo.git('log', '--decorate')
-        self.addDetail('git log', text_content(log_text))
+        self._add_git_detail('git log', 'log', '--decorate')
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '2.0.0-1': [f21],
@@ -1348,22 +1428,17 @@ class BranchTest(Base):
         )
 
     def test_files_stable_from_master(self):
-        self.repo.git('checkout', '2.0.0')
-        self.repo.git('checkout', '-b', 'stable/2')
+        self.repo.git('checkout', '-b', 'stable/2', '2.0.0')
         f21 = self._add_notes_file('slug21')
         self.repo.git('checkout', 'master')
-        log_text = self.repo.git('log', '--pretty=%x00%H %d', '--name-only',
-                                 'stable/2')
-        self.addDetail('git log', text_content(log_text))
+        self._add_git_detail('git log', 'log', '--pretty=%x00%H %d',
+                             '--name-only', 'stable/2')
         self.c.override(
             branch='stable/2',
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '2.0.0': [self.f2],
@@ -1373,13 +1448,11 @@ class BranchTest(Base):
         )
 
     def test_files_stable_from_master_no_stop_base(self):
-        self.repo.git('checkout', '2.0.0')
-        self.repo.git('checkout', '-b', 'stable/2')
+        self.repo.git('checkout', '-b', 'stable/2', '2.0.0')
         f21 = self._add_notes_file('slug21')
         self.repo.git('checkout', 'master')
-        log_text = self.repo.git('log', '--pretty=%x00%H %d', '--name-only',
-                                 'stable/2')
-        self.addDetail('git log', text_content(log_text))
+        self._add_git_detail('git log', 'log', '--pretty=%x00%H %d',
+                             '--name-only', 'stable/2')
         self.c.override(
             branch='stable/2',
         )
@@ -1388,10 +1461,7 @@ class BranchTest(Base):
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '1.0.0': [self.f1],
@@ -1402,33 +1472,25 @@ class BranchTest(Base):
         )
 
     def test_pre_release_branch_no_collapse(self):
-        f4 = self._add_notes_file('slug4')
-        self.repo.git('tag', '-s', '-m', 'pre-release', '4.0.0.0rc1')
+        f4 = self._add_notes_file('slug4', tag='4.0.0.0rc1',
+                                  tag_message='pre-release')
         # Add a commit on master after the tag
         self._add_notes_file('slug5')
         # Move back to the tag and create the branch
-        self.repo.git('checkout', '4.0.0.0rc1')
-        self.repo.git('checkout', '-b', 'stable/4')
+        self.repo.git('checkout', '-b', 'stable/4', '4.0.0.0rc1')
         # Create a commit on the branch
         f41 = self._add_notes_file('slug41')
-        log_text = self.repo.git(
-            'log', '--pretty=%x00%H %d', '--name-only', '--graph',
-            '--all', '--decorate',
-        )
-        self.addDetail('git log', text_content(log_text))
-        rev_list = self.repo.git('rev-list', '--first-parent',
-                                 '^stable/4', 'master')
-        self.addDetail('rev-list', text_content(rev_list))
+        self._add_git_detail('git log', 'log', '--pretty=%x00%H %d',
+                             '--name-only', '--graph', '--all', '--decorate')
+        self._add_git_detail('rev-list', 'rev-list', '--first-parent',
+                             '^stable/4', 'master')
         self.c.override(
             branch='stable/4',
             collapse_pre_releases=False,
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '4.0.0.0rc1': [f4],
@@ -1438,34 +1500,26 @@ class BranchTest(Base):
         )
 
     def test_pre_release_branch_collapse(self):
-        f4 = self._add_notes_file('slug4')
-        self.repo.git('tag', '-s', '-m', 'pre-release', '4.0.0.0rc1')
+        f4 = self._add_notes_file('slug4', tag='4.0.0.0rc1',
+                                  tag_message='pre-release')
         # Add a commit on master after the tag
         self._add_notes_file('slug5')
         # Move back to the tag and create the branch
-        self.repo.git('checkout', '4.0.0.0rc1')
-        self.repo.git('checkout', '-b', 'stable/4')
+        self.repo.git('checkout', '-b', 'stable/4', '4.0.0.0rc1')
         # Create a commit on the branch
-        f41 = self._add_notes_file('slug41')
-        self.repo.git('tag', '-s', '-m', 'release', '4.0.0')
-        log_text = self.repo.git(
-            'log', '--pretty=%x00%H %d', '--name-only', '--graph',
-            '--all', '--decorate',
-        )
-        self.addDetail('git log', text_content(log_text))
-        rev_list = self.repo.git('rev-list', '--first-parent',
-                                 '^stable/4', 'master')
-        self.addDetail('rev-list', text_content(rev_list))
+        f41 = self._add_notes_file('slug41', tag='4.0.0',
+                                   tag_message='release')
+        self._add_git_detail('git log', 'log', '--pretty=%x00%H %d',
+                             '--name-only', '--graph', '--all', '--decorate')
+        self._add_git_detail('rev-list', 'rev-list', '--first-parent',
+                             '^stable/4', 'master')
         self.c.override(
             branch='stable/4',
             collapse_pre_releases=True,
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '4.0.0': [f4, f41],
@@ -1474,36 +1528,27 @@ class BranchTest(Base):
         )
 
     def test_pre_release_note_before_branch(self):
-        f4 = self._add_notes_file('slug4')
-        self.repo.git('tag', '-s', '-m', 'beta', '4.0.0.0b1')
+        f4 = self._add_notes_file('slug4', tag='4.0.0.0b1', tag_message='beta')
         self.repo.add_file('not-a-release-note.txt')
-        self.repo.git('tag', '-s', '-m', 'pre-release', '4.0.0.0rc1')
+        self.repo.git('tag', '-a', '-m', 'pre-release', '4.0.0.0rc1')
         # Add a commit on master after the tag
         self._add_notes_file('slug5')
         # Move back to the tag and create the branch
-        self.repo.git('checkout', '4.0.0.0rc1')
-        self.repo.git('checkout', '-b', 'stable/4')
+        self.repo.git('checkout', '-b', 'stable/4', '4.0.0.0rc1')
         # Create a commit on the branch
-        f41 = self._add_notes_file('slug41')
-        self.repo.git('tag', '-s', '-m', 'release', '4.0.0')
-        log_text = self.repo.git(
-            'log', '--pretty=%x00%H %d', '--name-only', '--graph',
-            '--all', '--decorate',
-        )
-        self.addDetail('git log', text_content(log_text))
-        rev_list = self.repo.git('rev-list', '--first-parent',
-                                 '^stable/4', 'master')
-        self.addDetail('rev-list', text_content(rev_list))
+        f41 = self._add_notes_file('slug41', tag='4.0.0',
+                                   tag_message='release')
+        self._add_git_detail('git log', 'log', '--pretty=%x00%H %d',
+                             '--name-only', '--graph', '--all', '--decorate')
+        self._add_git_detail('rev-list', 'rev-list', '--first-parent',
+                             '^stable/4', 'master')
         self.c.override(
             branch='stable/4',
             collapse_pre_releases=True,
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '4.0.0': [f4, f41],
@@ -1512,32 +1557,23 @@ class BranchTest(Base):
         )
 
     def test_full_release_branch(self):
-        f4 = self._add_notes_file('slug4')
-        self.repo.git('tag', '-s', '-m', 'release', '4.0.0')
+        f4 = self._add_notes_file('slug4', tag='4.0.0', tag_message='release')
         # Add a commit on master after the tag
         self._add_notes_file('slug5')
         # Move back to the tag and create the branch
-        self.repo.git('checkout', '4.0.0')
-        self.repo.git('checkout', '-b', 'stable/4')
+        self.repo.git('checkout', '-b', 'stable/4', '4.0.0')
         # Create a commit on the branch
         f41 = self._add_notes_file('slug41')
-        log_text = self.repo.git(
-            'log', '--pretty=%x00%H %d', '--name-only', '--graph',
-            '--all', '--decorate',
-        )
-        self.addDetail('git log', text_content(log_text))
-        rev_list = self.repo.git('rev-list', '--first-parent',
-                                 '^stable/4', 'master')
-        self.addDetail('rev-list', text_content(rev_list))
+        self._add_git_detail('git log', 'log', '--pretty=%x00%H %d',
+                             '--name-only', '--graph', '--all', '--decorate')
+        self._add_git_detail('rev-list', 'rev-list', '--first-parent',
+                             '^stable/4', 'master')
         self.c.override(
             branch='stable/4',
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '4.0.0': [f4],
@@ -1549,29 +1585,21 @@ class BranchTest(Base):
     def test_branch_tip_of_master(self):
         # We have branched from master, but not added any commits to
         # master.
-        f4 = self._add_notes_file('slug4')
-        self.repo.git('tag', '-s', '-m', 'release', '4.0.0')
+        f4 = self._add_notes_file('slug4', tag='4.0.0', tag_message='release')
         self.repo.git('checkout', '-b', 'stable/4')
         # Create a commit on the branch
         f41 = self._add_notes_file('slug41')
         f42 = self._add_notes_file('slug42')
-        log_text = self.repo.git(
-            'log', '--pretty=%x00%H %d', '--name-only', '--graph',
-            '--all', '--decorate',
-        )
-        self.addDetail('git log', text_content(log_text))
-        rev_list = self.repo.git('rev-list', '--first-parent',
-                                 '^stable/4', 'master')
-        self.addDetail('rev-list', text_content(rev_list))
+        self._add_git_detail('git log', 'log', '--pretty=%x00%H %d',
+                             '--name-only', '--graph', '--all', '--decorate')
+        self._add_git_detail('rev-list', 'rev-list', '--first-parent',
+                             '^stable/4', 'master')
         self.c.override(
             branch='stable/4',
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '4.0.0': [f4],
@@ -1583,27 +1611,19 @@ class BranchTest(Base):
     def test_branch_no_more_commits(self):
         # We have branched from master, but not added any commits to
         # our branch or to master.
-        f4 = self._add_notes_file('slug4')
-        self.repo.git('tag', '-s', '-m', 'release', '4.0.0')
+        f4 = self._add_notes_file('slug4', tag='4.0.0', tag_message='release')
         self.repo.git('checkout', '-b', 'stable/4')
         # Create a commit on the branch
-        log_text = self.repo.git(
-            'log', '--pretty=%x00%H %d', '--name-only', '--graph',
-            '--all', '--decorate',
-        )
-        self.addDetail('git log', text_content(log_text))
-        rev_list = self.repo.git('rev-list', '--first-parent',
-                                 '^stable/4', 'master')
-        self.addDetail('rev-list', text_content(rev_list))
+        self._add_git_detail('git log', 'log', '--pretty=%x00%H %d',
+                             '--name-only', '--graph', '--all', '--decorate')
+        self._add_git_detail('rev-list', 'rev-list', '--first-parent',
+                             '^stable/4', 'master')
         self.c.override(
             branch='stable/4',
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '4.0.0': [f4],
@@ -1611,73 +1631,32 @@ class BranchTest(Base):
             results,
         )
 
+    def _clone_repo(self):
+        """Add a stable/2 branch and return the Config for a clone."""
+        self.repo.git('branch', 'stable/2', '2.0.0')
+        # --shared makes the clone borrow the original's objects
+        # instead of copying them.
+        utils.check_output(
+            ['git', 'clone', '--shared', self.reporoot, 'reporoot2'],
+            cwd=self.temp_dir,
+        )
+        return config.Config(os.path.join(self.temp_dir, 'reporoot2'))
+
     def test_remote_branches(self):
-        self.repo.git('checkout', '2.0.0')
-        self.repo.git('checkout', '-b', 'stable/2')
-        self.repo.git('checkout', 'master')
+        c2 = self._clone_repo()
         with scanner.Scanner(self.c) as scanner1:
             head1 = scanner1._get_ref('stable/2')
         self.assertIsNotNone(head1)
-        print('head1', head1)
-        # Create a second repository by cloning the first.
-        print(utils.check_output(
-            ['git', 'clone', self.reporoot, 'reporoot2'],
-            cwd=self.temp_dir,
-        ))
-        reporoot2 = os.path.join(self.temp_dir, 'reporoot2')
-        print(utils.check_output(
-            ['git', 'remote', 'update'],
-            cwd=reporoot2,
-        ))
-        print(utils.check_output(
-            ['git', 'remote', '-v'],
-            cwd=reporoot2,
-        ))
-        print(utils.check_output(
-            ['find', '.git/refs'],
-            cwd=reporoot2,
-        ))
-        print(utils.check_output(
-            ['git', 'branch', '-a'],
-            cwd=reporoot2,
-        ))
-        c2 = config.Config(reporoot2)
         with scanner.Scanner(c2) as scanner2:
             head2 = scanner2._get_ref('origin/stable/2')
         self.assertIsNotNone(head2)
         self.assertEqual(head1, head2)
 
     def test_remote_branch_without_prefix(self):
-        self.repo.git('checkout', '2.0.0')
-        self.repo.git('checkout', '-b', 'stable/2')
-        self.repo.git('checkout', 'master')
+        c2 = self._clone_repo()
         with scanner.Scanner(self.c) as scanner1:
             head1 = scanner1._get_ref('stable/2')
         self.assertIsNotNone(head1)
-        print('head1', head1)
-        # Create a second repository by cloning the first.
-        print(utils.check_output(
-            ['git', 'clone', self.reporoot, 'reporoot2'],
-            cwd=self.temp_dir,
-        ))
-        reporoot2 = os.path.join(self.temp_dir, 'reporoot2')
-        print(utils.check_output(
-            ['git', 'remote', 'update'],
-            cwd=reporoot2,
-        ))
-        print(utils.check_output(
-            ['git', 'remote', '-v'],
-            cwd=reporoot2,
-        ))
-        print(utils.check_output(
-            ['find', '.git/refs'],
-            cwd=reporoot2,
-        ))
-        print(utils.check_output(
-            ['git', 'branch', '-a'],
-            cwd=reporoot2,
-        ))
-        c2 = config.Config(reporoot2)
         with scanner.Scanner(c2) as scanner2:
             head2 = scanner2._get_ref('stable/2')
         self.assertIsNotNone(head2)
@@ -1687,9 +1666,7 @@ class BranchTest(Base):
         # Modify a note from a stable branch on master and ensure that
         # the note does not appear in the scanner output from master.
         # This should replicate the problem described in bug #1682796
-        self.repo.git('checkout', '2.0.0')
-        self.repo.git('branch', 'stable/2')
-        self.repo.git('checkout', 'master')
+        self.repo.git('branch', 'stable/2', '2.0.0')
         with open(os.path.join(self.reporoot, self.f1), 'w') as f:
             f.write('new file contents')
         self.repo.commit('update %s' % self.f1)
@@ -1698,10 +1675,7 @@ class BranchTest(Base):
         )
         with scanner.Scanner(self.c) as s:
             raw_results = s.get_notes_by_version()
-        results = {
-            k: [f for (f, n) in v]
-            for (k, v) in raw_results.items()
-        }
+        results = _files_only(raw_results)
         self.assertEqual(
             {
                 '2.0.0': [self.f2],
@@ -1713,33 +1687,31 @@ class BranchTest(Base):
 
 class ScanStopPointPrereleaseVersionsTest(Base):
 
+    copy_repo_template = False
+
     def setUp(self):
         super(ScanStopPointPrereleaseVersionsTest, self).setUp()
-        self.scanner = scanner.Scanner(self.c)
+        self.scanner = self._get_shared_scanner()
+
+    def setUpRepo(self):
         self._make_python_package()
-        self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first series', '1.0.0.0rc1')
+        self._add_notes_file('slug1', tag='1.0.0.0rc1',
+                             tag_message='first series')
         self.repo.git('checkout', '-b', 'stable/a')
         self._add_notes_file('slug2')
-        self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'second tag', '1.0.0')
+        self._add_notes_file('slug3', tag='1.0.0', tag_message='second tag')
         self.repo.git('checkout', 'master')
         self._add_notes_file('slug4')
-        self._add_notes_file('slug5')
-        self.repo.git('tag', '-s', '-m', 'second series', '2.0.0.0b3')
+        self._add_notes_file('slug5', tag='2.0.0.0b3',
+                             tag_message='second series')
         self._add_notes_file('slug6')
-        self._add_notes_file('slug7')
-        self.repo.git('tag', '-s', '-m', 'second tag', '2.0.0.0rc1')
+        self._add_notes_file('slug7', tag='2.0.0.0rc1',
+                             tag_message='second tag')
         self.repo.git('checkout', '-b', 'stable/b')
         self._add_notes_file('slug8')
-        self._add_notes_file('slug9')
-        self.repo.git('tag', '-s', '-m', 'third tag', '2.0.0')
+        self._add_notes_file('slug9', tag='2.0.0', tag_message='third tag')
         self.repo.git('checkout', 'master')
 
-    def tearDown(self):
-        self.scanner.close()
-        super().tearDown()
-
     def test_beta_collapse(self):
         self.assertEqual(
             '1.0.0.0rc1',
@@ -1805,33 +1777,28 @@ class ScanStopPointPrereleaseVersionsTest(Base):
 
 class ScanStopPointRegularVersionsTest(Base):
 
+    copy_repo_template = False
+
     def setUp(self):
         super(ScanStopPointRegularVersionsTest, self).setUp()
-        self.scanner = scanner.Scanner(self.c)
+        self.scanner = self._get_shared_scanner()
+
+    def setUpRepo(self):
         self._make_python_package()
-        self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first series', '1.0.0')
+        self._add_notes_file('slug1', tag='1.0.0', tag_message='first series')
         self.repo.git('checkout', '-b', 'stable/a')
         self._add_notes_file('slug2')
-        self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'second tag', '1.0.1')
+        self._add_notes_file('slug3', tag='1.0.1', tag_message='second tag')
         self.repo.git('checkout', 'master')
         self._add_notes_file('slug4')
-        self._add_notes_file('slug5')
-        self.repo.git('tag', '-s', '-m', 'second series', '2.0.0')
+        self._add_notes_file('slug5', tag='2.0.0', tag_message='second series')
         self._add_notes_file('slug6')
-        self._add_notes_file('slug7')
-        self.repo.git('tag', '-s', '-m', 'second tag', '2.0.1')
+        self._add_notes_file('slug7', tag='2.0.1', tag_message='second tag')
         self.repo.git('checkout', '-b', 'stable/b')
         self._add_notes_file('slug8')
-        self._add_notes_file('slug9')
-        self.repo.git('tag', '-s', '-m', 'third tag', '2.0.2')
+        self._add_notes_file('slug9', tag='2.0.2', tag_message='third tag')
         self.repo.git('checkout', 'master')
 
-    def tearDown(self):
-        self.scanner.close()
-        super().tearDown()
-
     def test_invalid_earliest_version(self):
         self.assertIsNone(
             self.scanner._find_scan_stop_point(
@@ -1867,16 +1834,20 @@ class ScanStopPointRegularVersionsTest(Base):
 
 class GetRefTest(Base):
 
+    sign_tags = True
+
     def setUp(self):
         super(GetRefTest, self).setUp()
+        self.scanner = scanner.Scanner(self.c)
+
+    def setUpRepo(self):
         self._make_python_package()
-        self.f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
+        self.f1 = self._add_notes_file('slug1', tag='1.0.0',
+                                       tag_message='first tag')
         self.repo.git('branch', 'stable/foo')
         self.repo.git('tag', 'bar-eol')
         self.repo.git('tag', 'bar-eom')
         self.repo.git('tag', 'baz-eom')
-        self.scanner = scanner.Scanner(self.c)
 
     def tearDown(self):
         self.scanner.close()
@@ -1927,15 +1898,13 @@ class GetRefTest(Base):
 
 class TagsTest(Base):
 
-    def setUp(self):
-        super(TagsTest, self).setUp()
+    def setUpRepo(self):
         self._make_python_package()
-        self.f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        self.f2 = self._add_notes_file('slug2')
-        self.repo.git('tag', '-s', '-m', 'first tag', '2.0.0')
-        self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'first tag', '3.0.0')
+        self.f1 = self._add_notes_file('slug1', tag='1.0.0',
+                                       tag_message='first tag')
+        self.f2 = self._add_notes_file('slug2', tag='2.0.0',
+                                       tag_message='first tag')
+        self._add_notes_file('slug3', tag='3.0.0', tag_message='first tag')
 
     def test_master(self):
         with scanner.Scanner(self.c) as s:
@@ -1952,10 +1921,8 @@ class TagsTest(Base):
         self.assertEqual(expected, ref)
 
     def test_not_master(self):
-        self.repo.git('checkout', '2.0.0')
-        self.repo.git('checkout', '-b', 'not-master')
-        self._add_notes_file('slug4')
-        self.repo.git('tag', '-s', '-m', 'not on master', '2.0.1')
+        self.repo.git('checkout', '-b', 'not-master', '2.0.0')
+        self._add_notes_file('slug4', tag='2.0.1', tag_message='not on master')
         self.repo.git('checkout', 'master')
         with scanner.Scanner(self.c) as s:
             results = s._get_tags_on_branch('not-master')
@@ -1975,8 +1942,7 @@ class TagsTest(Base):
         )
 
     def test_tagged_tag_annotated(self):
-        time.sleep(1)
-        self.repo.git('tag', '-s', '-m', 'fourth tag', '4.0.0', '3.0.0')
+        self.repo.git('tag', '-a', '-m', 'fourth tag', '4.0.0', '3.0.0')
         with scanner.Scanner(self.c) as s:
             results = s._get_tags_on_branch(None)
         self.assertEqual(
@@ -1985,7 +1951,6 @@ class TagsTest(Base):
         )
 
     def test_tagged_tag_lightweight(self):
-        time.sleep(1)
         self.repo.git('tag', '-m', 'fourth tag', '4.0.0', '3.0.0')
         with scanner.Scanner(self.c) as s:
             results = s._get_tags_on_branch(None)
@@ -1997,15 +1962,13 @@ class TagsTest(Base):
 
 class VersionTest(Base):
 
-    def setUp(self):
-        super(VersionTest, self).setUp()
+    def setUpRepo(self):
         self._make_python_package()
-        self.f1 = self._add_notes_file('slug1')
-        self.repo.git('tag', '-s', '-m', 'first tag', '1.0.0')
-        self.f2 = self._add_notes_file('slug2')
-        self.repo.git('tag', '-s', '-m', 'second tag', '2.0.0')
-        self._add_notes_file('slug3')
-        self.repo.git('tag', '-s', '-m', 'third tag', '3.0.0')
+        self.f1 = self._add_notes_file('slug1', tag='1.0.0',
+                                       tag_message='first tag')
+        self.f2 = self._add_notes_file('slug2', tag='2.0.0',
+                                       tag_message='second tag')
+        self._add_notes_file('slug3', tag='3.0.0', tag_message='third tag')
 
     def test_tagged_head(self):
         with scanner.Scanner(self.c) as s:
@@ -2025,12 +1988,7 @@ class VersionTest(Base):
         )
 
     def test_multiple_tags(self):
-        # The timestamp resolution appears to be 1 second, so sleep to
-        # ensure distinct timestamps for the 2 tags. In practice it is
-        # unlikely that anything could apply 2 signed tags within a
-        # single second (certainly not a person).
-        time.sleep(1)
-        self.repo.git('tag', '-s', '-m', 'fourth tag', '4.0.0')
+        self.repo.git('tag', '-a', '-m', 'fourth tag', '4.0.0')
         with scanner.Scanner(self.c) as s:
             results = s._get_current_version(None)
         self.assertEqual(
@@ -2039,28 +1997,59 @@ class VersionTest(Base):
         )
 
 
-class AggregateChangesTest(Base):
+# Stand-ins for the dulwich walk entries aggregate_changes() reads
+# entry.commit.id from.
+_FakeCommit = collections.namedtuple('_FakeCommit', ['id'])
+_FakeEntry = collections.namedtuple('_FakeEntry', ['commit'])
+
+# The side of a TreeChange that does not exist for an add or a delete.
+_EMPTY_ENTRY = objects.TreeEntry(path=None, mode=None, sha=None)
+
+
+def _tree_entry(path, sha):
+    return objects.TreeEntry(path=path.encode('utf-8'), mode='0222', sha=sha)
+
+
+def _add(path, sha='not-a-hash'):
+    return diff_tree.TreeChange(
+        type=diff_tree.CHANGE_ADD,
+        old=_EMPTY_ENTRY,
+        new=_tree_entry(path, sha),
+    )
+
+
+def _del(path, sha='not-a-hash'):
+    return diff_tree.TreeChange(
+        type=diff_tree.CHANGE_DELETE,
+        old=_tree_entry(path, sha),
+        new=_EMPTY_ENTRY,
+    )
+
+
+def _mod(path, old_sha, new_sha):
+    return diff_tree.TreeChange(
+        type=diff_tree.CHANGE_MODIFY,
+        old=_tree_entry(path, old_sha),
+        new=_tree_entry(path, new_sha),
+    )
+
+
+class AggregateChangesTest(base.TestCase):
+
+    # The aggregator only sees the changes passed to it, so these
+    # tests do not need a git repository.
 
     def setUp(self):
         super(AggregateChangesTest, self).setUp()
         self.aggregator = scanner._ChangeAggregator()
+        self._counter = itertools.count(1)
+        self.get_note_num = lambda: next(self._counter)
 
     def test_ignore(self):
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         name = 'prefix/add-%016x' % n  # no .yaml extension
-        entry.commit.id = 'commit-id'
-        changes = [
-            diff_tree.TreeChange(
-                type=diff_tree.CHANGE_ADD,
-                old=objects.TreeEntry(path=None, mode=None, sha=None),
-                new=objects.TreeEntry(
-                    path=name.encode('utf-8'),
-                    mode='0222',
-                    sha='not-a-hash',
-                )
-            )
-        ]
+        changes = [_add(name)]
         results = self.aggregator.aggregate_changes(entry, changes)
         self.assertEqual(
             [],
@@ -2068,21 +2057,10 @@ class AggregateChangesTest(Base):
         )
 
     def test_add(self):
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         name = 'prefix/add-%016x.yaml' % n
-        entry.commit.id = 'commit-id'
-        changes = [
-            diff_tree.TreeChange(
-                type=diff_tree.CHANGE_ADD,
-                old=objects.TreeEntry(path=None, mode=None, sha=None),
-                new=objects.TreeEntry(
-                    path=name.encode('utf-8'),
-                    mode='0222',
-                    sha='not-a-hash',
-                )
-            )
-        ]
+        changes = [_add(name)]
         results = list(self.aggregator.aggregate_changes(entry, changes))
         self.assertEqual(
             [('%016x' % n, 'add', name, 'commit-id')],
@@ -2093,24 +2071,13 @@ class AggregateChangesTest(Base):
         # Adding multiple files in one commit using the same UID but
         # different slug after we have seen a delete for the same UID
         # causes the files to be ignored.
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         uid = '%016x' % n
-        changes = []
-        for i in range(2):
-            name = 'prefix/add%d-%s.yaml' % (i, uid)
-            entry.commit.id = 'commit-id'
-            changes.append(
-                diff_tree.TreeChange(
-                    type=diff_tree.CHANGE_ADD,
-                    old=objects.TreeEntry(path=None, mode=None, sha=None),
-                    new=objects.TreeEntry(
-                        path=name.encode('utf-8'),
-                        mode='0222',
-                        sha='not-a-hash',
-                    )
-                )
-            )
+        changes = [
+            _add('prefix/add%d-%s.yaml' % (i, uid))
+            for i in range(2)
+        ]
         # Set up the aggregator as though it had already seen a delete
         # operation. Since the scan happens in reverse chronological
         # order, the delete would have happened after the add, and we
@@ -2124,24 +2091,13 @@ class AggregateChangesTest(Base):
         # Adding multiple files in one commit using the same UID but
         # different slug without a delete operation causes an
         # exception.
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         uid = '%016x' % n
-        changes = []
-        for i in range(2):
-            name = 'prefix/add%d-%s.yaml' % (i, uid)
-            entry.commit.id = 'commit-id'
-            changes.append(
-                diff_tree.TreeChange(
-                    type=diff_tree.CHANGE_ADD,
-                    old=objects.TreeEntry(path=None, mode=None, sha=None),
-                    new=objects.TreeEntry(
-                        path=name.encode('utf-8'),
-                        mode='0222',
-                        sha='not-a-hash',
-                    )
-                )
-            )
+        changes = [
+            _add('prefix/add%d-%s.yaml' % (i, uid))
+            for i in range(2)
+        ]
 
         # aggregate_changes() is a generator, so we have to wrap it in
         # list() to process the data, so we need a little temporary
@@ -2155,21 +2111,10 @@ class AggregateChangesTest(Base):
         )
 
     def test_delete(self):
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         name = 'prefix/delete-%016x.yaml' % n
-        entry.commit.id = 'commit-id'
-        changes = [
-            diff_tree.TreeChange(
-                type=diff_tree.CHANGE_DELETE,
-                old=objects.TreeEntry(
-                    path=name.encode('utf-8'),
-                    mode='0222',
-                    sha='not-a-hash',
-                ),
-                new=objects.TreeEntry(path=None, mode=None, sha=None)
-            )
-        ]
+        changes = [_del(name)]
         results = list(self.aggregator.aggregate_changes(entry, changes))
         self.assertEqual(
             [('%016x' % n, 'delete', name, entry.commit.id)],
@@ -2179,48 +2124,22 @@ class AggregateChangesTest(Base):
     def test_delete_multiple(self):
         # Delete multiple files in one commit using the same UID but
         # different slug.
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         changes = []
         expected = []
         for i in range(2):
             name = 'prefix/delete%d-%016x.yaml' % (i, n)
-            entry.commit.id = 'commit-id'
-            changes.append(
-                diff_tree.TreeChange(
-                    type=diff_tree.CHANGE_DELETE,
-                    old=objects.TreeEntry(
-                        path=name.encode('utf-8'),
-                        mode='0222',
-                        sha='not-a-hash',
-                    ),
-                    new=objects.TreeEntry(path=None, mode=None, sha=None),
-                )
-            )
+            changes.append(_del(name))
             expected.append(('%016x' % n, 'delete', name, 'commit-id'))
         results = list(self.aggregator.aggregate_changes(entry, changes))
         self.assertEqual(expected, results)
 
     def test_change(self):
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         name = 'prefix/change-%016x.yaml' % n
-        entry.commit.id = 'commit-id'
-        changes = [
-            diff_tree.TreeChange(
-                type=diff_tree.CHANGE_MODIFY,
-                old=objects.TreeEntry(
-                    path=name.encode('utf-8'),
-                    mode='0222',
-                    sha='old-sha',
-                ),
-                new=objects.TreeEntry(
-                    path=name.encode('utf-8'),
-                    mode='0222',
-                    sha='new-sha',
-                ),
-            )
-        ]
+        changes = [_mod(name, 'old-sha', 'new-sha')]
         results = list(self.aggregator.aggregate_changes(entry, changes))
         self.assertEqual(
             [('%016x' % n, 'modify', name, 'commit-id')],
@@ -2228,30 +2147,13 @@ class AggregateChangesTest(Base):
         )
 
     def test_add_then_delete(self):
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         new_name = 'prefix/new-%016x.yaml' % n
         old_name = 'prefix/old-%016x.yaml' % n
-        entry.commit.id = 'commit-id'
         changes = [
-            diff_tree.TreeChange(
-                type=diff_tree.CHANGE_ADD,
-                old=objects.TreeEntry(path=None, mode=None, sha=None),
-                new=objects.TreeEntry(
-                    path=new_name.encode('utf-8'),
-                    mode='0222',
-                    sha='new-hash',
-                )
-            ),
-            diff_tree.TreeChange(
-                type=diff_tree.CHANGE_DELETE,
-                old=objects.TreeEntry(
-                    path=old_name.encode('utf-8'),
-                    mode='0222',
-                    sha='old-hash',
-                ),
-                new=objects.TreeEntry(path=None, mode=None, sha=None)
-            )
+            _add(new_name, 'new-hash'),
+            _del(old_name, 'old-hash'),
         ]
         results = list(self.aggregator.aggregate_changes(entry, changes))
         self.assertEqual(
@@ -2260,30 +2162,13 @@ class AggregateChangesTest(Base):
         )
 
     def test_delete_then_add(self):
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         new_name = 'prefix/new-%016x.yaml' % n
         old_name = 'prefix/old-%016x.yaml' % n
-        entry.commit.id = 'commit-id'
         changes = [
-            diff_tree.TreeChange(
-                type=diff_tree.CHANGE_DELETE,
-                old=objects.TreeEntry(
-                    path=old_name.encode('utf-8'),
-                    mode='0222',
-                    sha='old-hash',
-                ),
-                new=objects.TreeEntry(path=None, mode=None, sha=None)
-            ),
-            diff_tree.TreeChange(
-                type=diff_tree.CHANGE_ADD,
-                old=objects.TreeEntry(path=None, mode=None, sha=None),
-                new=objects.TreeEntry(
-                    path=new_name.encode('utf-8'),
-                    mode='0222',
-                    sha='new-hash',
-                )
-            ),
+            _del(old_name, 'old-hash'),
+            _add(new_name, 'new-hash'),
         ]
         results = list(self.aggregator.aggregate_changes(entry, changes))
         self.assertEqual(
@@ -2296,13 +2181,12 @@ class AggregateChangesTest(Base):
         # changes() returns a list with nested lists. See commit
         # cc11da6dcfb1dbaa015e9804b6a23f7872380c1b in this repo for an
         # example.
-        entry = mock.Mock()
+        entry = _FakeEntry(_FakeCommit('commit-id'))
         n = self.get_note_num()
         # The files modified by the commit are actually
         # reno/scanner.py, but the fake names are used in this test to
         # comply with the rest of the configuration for the scanner.
         old_name = 'prefix/old-%016x.yaml' % n
-        entry.commit.id = 'commit-id'
         changes = [[
             diff_tree.TreeChange(
                 type='modify',
@@ -2498,7 +2382,7 @@ class GetSeriesBranchesTest(Base):
 
     def test_eol_tag(self):
         self.repo.git(
-            'tag', '-s', '-m', 'closed branch', 'a-eol',
+            'tag', '-a', '-m', 'closed branch', 'a-eol',
         )
         with scanner.Scanner(self.c) as s:
             branches = s.get_series_branches()
@@ -2506,7 +2390,7 @@ class GetSeriesBranchesTest(Base):
 
     def test_mix_tag_and_branch(self):
         self.repo.git(
-            'tag', '-s', '-m', 'closed branch', 'a-eol',
+            'tag', '-a', '-m', 'closed branch', 'a-eol',
         )
         self.repo.git(
             'checkout', '-b', 'stable/b',
@@ -2514,3 +2398,52 @@ class GetSeriesBranchesTest(Base):
         with scanner.Scanner(self.c) as s:
             branches = s.get_series_branches()
         self.assertEqual(['stable/a', 'stable/b'], branches)
+
+
+class CacheHeadTest(Base):
+
+    def setUp(self):
+        super(CacheHeadTest, self).setUp()
+        self.n1 = self._add_notes_file(tag='1.0.0', tag_message='first tag')
+
+    def _load(self, conf):
+        with loader.Loader(conf) as ldr:
+            return ldr._cache is not None, _files_only(ldr._scanner_output)
+
+    def test_cache_used(self):
+        cache.write_cache_db(self.c, [])
+        used, results = self._load(self.c)
+        self.assertTrue(used)
+        self.assertEqual({'1.0.0': [self.n1]}, results)
+
+    def test_new_commit(self):
+        cache.write_cache_db(self.c, [])
+        n2 = self._add_notes_file()
+        used, results = self._load(self.c)
+        self.assertFalse(used)
+        self.assertEqual({'1.0.0': [self.n1], '1.0.0-1': [n2]}, results)
+
+    def test_packed_refs(self):
+        cache.write_cache_db(self.c, [])
+        # Packing rewrites the refs without moving the branch.
+        self.repo.git('pack-refs', '--all', '--prune')
+        used, results = self._load(self.c)
+        self.assertTrue(used)
+
+    def test_worktree(self):
+        worktree = os.path.join(self.temp_dir, 'worktree')
+        self.repo.git('worktree', 'add', '-q', '-b', 'other', worktree)
+        conf = config.Config(worktree)
+        cache.write_cache_db(conf, [])
+        used, results = self._load(conf)
+        self.assertTrue(used)
+
+    def test_worktree_new_commit(self):
+        worktree = os.path.join(self.temp_dir, 'worktree')
+        self.repo.git('worktree', 'add', '-q', '-b', 'other', worktree)
+        conf = config.Config(worktree)
+        cache.write_cache_db(conf, [])
+        self.repo.git('-C', worktree, 'commit', '-q', '--allow-empty',
+                      '-m', 'another commit')
+        used, results = self._load(conf)
+        self.assertFalse(used)
@@ -13,11 +13,9 @@
 # under the License.
 
 import collections
-from unittest import mock
+import copy
 
 import fixtures
-import textwrap
-
 
 from reno import config
 from reno import semver
@@ -27,30 +25,36 @@ from reno.tests import base
 class TestSemVer(base.TestCase):
 
     note_bodies = {
-        'none': textwrap.dedent("""
-        prelude: >
-          This should not cause any version update.
-        """),
-        'major': textwrap.dedent("""
-        upgrade:
-          - This should cause a major version update.
-        """),
-        'minor': textwrap.dedent("""
-        features:
-          - This should cause a minor version update.
-        """),
-        'patch': textwrap.dedent("""
-        fixes:
-          - This should cause a patch version update.
-        """),
+        'none': (
+            'prelude: >\n'
+            '  This should not cause any version update.\n'
+        ),
+        'major': (
+            'upgrade:\n'
+            '  - This should cause a major version update.\n'
+        ),
+        'minor': (
+            'features:\n'
+            '  - This should cause a minor version update.\n'
+        ),
+        'patch': (
+            'fixes:\n'
+            '  - This should cause a patch version update.\n'
+        ),
     }
 
     def _get_note_body(self, filename, sha):
+        self.notes_read.append(filename)
         return self.note_bodies.get(filename, '')
 
     def _get_dates(self):
         return {'1.0.0': 1547874431}
 
+    @classmethod
+    def setUpClass(cls):
+        super(TestSemVer, cls).setUpClass()
+        cls._config_template = config.Config('.')
+
     def setUp(self):
         super(TestSemVer, self).setUp()
         self.useFixture(
@@ -61,29 +65,30 @@ class TestSemVer(base.TestCase):
             fixtures.MockPatch('reno.scanner.Scanner.get_version_dates',
                                new=self._get_dates)
         )
-        self.c = config.Config('.')
-
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_same(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+        self.mock_get_notes = self.useFixture(
+            fixtures.MockPatch('reno.scanner.Scanner.get_notes_by_version')
+        ).mock
+        self.c = copy.copy(self._config_template)
+        self.notes_read = []
+
+    def test_same(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('1.1.1', []),
         ])
         expected = '1.1.1'
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_same_with_note(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_same_with_note(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('1.1.1', [('none', 'shaA')]),
         ])
         expected = '1.1.1'
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_major_working_copy(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_major_working_copy(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('*working-copy*', [('major', 'shaA')]),
             ('1.1.1', []),
         ])
@@ -91,9 +96,8 @@ class TestSemVer(base.TestCase):
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_major_working_and_post_release(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_major_working_and_post_release(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('*working-copy*', [('none', 'shaA')]),
             ('1.1.1-1', [('major', 'shaA')]),
         ])
@@ -101,18 +105,16 @@ class TestSemVer(base.TestCase):
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_major_post_release(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_major_post_release(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('1.1.1-1', [('major', 'shaA')]),
         ])
         expected = '2.0.0'
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_minor_working_copy(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_minor_working_copy(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('*working-copy*', [('minor', 'shaA')]),
             ('1.1.1', []),
         ])
@@ -120,9 +122,8 @@ class TestSemVer(base.TestCase):
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_minor_working_and_post_release(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_minor_working_and_post_release(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('*working-copy*', [('none', 'shaA')]),
             ('1.1.1-1', [('minor', 'shaA')]),
         ])
@@ -130,18 +131,16 @@ class TestSemVer(base.TestCase):
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_minor_post_release(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_minor_post_release(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('1.1.1-1', [('minor', 'shaA')]),
         ])
         expected = '1.2.0'
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_patch_working_copy(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_patch_working_copy(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('*working-copy*', [('patch', 'shaA')]),
             ('1.1.1', []),
         ])
@@ -149,9 +148,8 @@ class TestSemVer(base.TestCase):
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_patch_working_and_post_release(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_patch_working_and_post_release(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('*working-copy*', [('none', 'shaA')]),
             ('1.1.1-1', [('patch', 'shaA')]),
         ])
@@ -159,11 +157,41 @@ class TestSemVer(base.TestCase):
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
 
-    @mock.patch('reno.scanner.Scanner.get_notes_by_version')
-    def test_patch_post_release(self, mock_get_notes):
-        mock_get_notes.return_value = collections.OrderedDict([
+    def test_patch_post_release(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
             ('1.1.1-1', [('patch', 'shaA')]),
         ])
         expected = '1.1.2'
         actual = semver.compute_next_version(self.c)
         self.assertEqual(expected, actual)
+
+    def test_minor_then_major(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
+            ('*working-copy*', [('minor', 'shaA')]),
+            ('1.1.1-1', [('major', 'shaA')]),
+        ])
+        expected = '2.0.0'
+        actual = semver.compute_next_version(self.c)
+        self.assertEqual(expected, actual)
+
+    def test_minor_then_patch(self):
+        self.mock_get_notes.return_value = collections.OrderedDict([
+            ('*working-copy*', [('minor', 'shaA')]),
+            ('1.1.1-1', [('patch', 'shaA')]),
+        ])
+        expected = '1.2.0'
+        actual = semver.compute_next_version(self.c)
+        self.assertEqual(expected, actual)
+
+    def test_minor_without_major_sections(self):
+        # With no major sections configured nothing after a minor
+        # bump can change the answer, so the later notes are not read.
+        self.c.override(semver_major=[])
+        self.mock_get_notes.return_value = collections.OrderedDict([
+            ('*working-copy*', [('minor', 'shaA')]),
+            ('1.1.1-1', [('major', 'shaA'), ('patch', 'shaA')]),
+        ])
+        expected = '1.2.0'
+        actual = semver.compute_next_version(self.c)
+        self.assertEqual(expected, actual)
+        self.assertEqual(['minor'], self.notes_read)
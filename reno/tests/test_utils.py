@@ -20,22 +20,23 @@ from reno import utils
 
 class TestGetRandomString(base.TestCase):
 
-    @mock.patch('random.randrange')
+    @mock.patch('random.getrandbits')
     @mock.patch('os.urandom')
-    def test_no_urandom(self, urandom, randrange):
-        urandom.side_effect = Exception('cannot use this')
-        randrange.return_value = ord('a')
+    def test_no_urandom(self, urandom, getrandbits):
+        urandom.side_effect = NotImplementedError('cannot use this')
+        getrandbits.return_value = int.from_bytes(b'a' * 8, 'little')
         actual = utils.get_random_string()
         expected = '61' * 8  # hex for ord('a')
         self.assertIsInstance(actual, str)
         self.assertEqual(expected, actual)
 
-    @mock.patch('random.randrange')
+    @mock.patch('random.getrandbits')
     @mock.patch('os.urandom')
-    def test_with_urandom(self, urandom, randrange):
+    def test_with_urandom(self, urandom, getrandbits):
         urandom.return_value = b'\x62' * 8
-        randrange.return_value = ord('a')
+        getrandbits.return_value = int.from_bytes(b'a' * 8, 'little')
         actual = utils.get_random_string()
         expected = '62' * 8  # hex for ord('b')
         self.assertIsInstance(actual, str)
         self.assertEqual(expected, actual)
+        getrandbits.assert_not_called()
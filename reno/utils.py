@@ -10,7 +10,6 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import binascii
 import logging
 import os
 import os.path
@@ -27,28 +26,23 @@ def get_random_string(nbytes=8):
     """
     try:
         # NOTE(dhellmann): Not all systems support urandom().
-        # hexlify returns binary, decode to convert to str.
-        val = binascii.hexlify(os.urandom(nbytes)).decode('utf-8')
-    except Exception as e:
+        val = os.urandom(nbytes).hex()
+    except (NotImplementedError, OSError) as e:
         print('ERROR, perhaps urandom is not supported: %s' % e)
-        val = u''.join(u'%02x' % random.randrange(256)
-                       for i in range(nbytes))
+        val = random.getrandbits(nbytes * 8).to_bytes(nbytes, 'little').hex()
     return val
 
 
 def check_output(*args, **kwds):
     """Unicode-aware wrapper for subprocess.check_output"""
-    process = subprocess.Popen(stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE,
-                               *args, **kwds)
-    output, errors = process.communicate()
-    retcode = process.poll()
-    if errors:
+    result = subprocess.run(*args, capture_output=True, **kwds)
+    if result.stderr:
         LOG.debug('ran: %s', ' '.join(*args))
-        LOG.debug('returned: %s', retcode)
-        LOG.debug('error output: %s', errors.rstrip())
-        LOG.debug('regular output: %s', output.rstrip())
-    if retcode:
+        LOG.debug('returned: %s', result.returncode)
+        LOG.debug('error output: %s', result.stderr.rstrip())
+        LOG.debug('regular output: %s', result.stdout.rstrip())
+    if result.returncode:
         LOG.debug('raising error')
-        raise subprocess.CalledProcessError(retcode, args, output=output)
-    return output.decode('utf-8')
+        raise subprocess.CalledProcessError(result.returncode, args,
+                                            output=result.stdout)
+    return result.stdout.decode('utf-8')